@@ -1,5 +1,8 @@
 import collections
-from collections.abc import Callable, Iterable, Iterator
+import contextlib
+import functools
+import importlib
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from inspect import Parameter, signature
 from os.path import dirname, join
 from typing import (
@@ -12,7 +15,9 @@ from typing import (
 from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import FieldDoesNotExist
-from django.db import transaction
+from django.core.files.storage import InMemoryStorage
+from django.core.signals import setting_changed
+from django.db import connections, router, transaction
 from django.db.models import (
     AutoField,
     BooleanField,
@@ -33,10 +38,17 @@ from django.db.models.fields.reverse_related import (
     ManyToOneRel,
     OneToOneRel,
 )
+from django.dispatch import receiver
+from django.utils.choices import CallableChoiceIterator
+from django.utils.module_loading import module_has_submodule
 
-from . import generators, random_gen
+from . import generators, numpy_gen, random_gen
 from ._types import M, NewM
-from .content_types import BAKER_CONTENTTYPES
+from .content_types import (
+    BAKER_CONTENTTYPES,
+    get_cached_content_type,
+    get_content_type,
+)
 from .exceptions import (
     AmbiguousModelName,
     CustomBakerNotFound,
@@ -74,6 +86,11 @@ __all__ = [
     "prepare",
     "make_recipe",
     "prepare_recipe",
+    "autodiscover_recipes",
+    "clear_in_memory_files",
+    "get_recipes_for_model",
+    "random_stream",
+    "reset_sequences",
     "seed",
     "seq",
 ]
@@ -83,6 +100,24 @@ def _valid_quantity(quantity: str | int | None) -> bool:
     return quantity is not None and (not isinstance(quantity, int) or quantity < 1)
 
 
+def _batched(
+    baker: "Baker", quantity: int, commit: bool, attrs: dict[str, Any]
+) -> contextlib.AbstractContextManager:
+    """Generate values in batches when making many instances, if supported."""
+    if quantity > 1 and isinstance(baker, Baker):
+        return baker._generate_in_batches(quantity, commit, attrs)
+    return contextlib.nullcontext()
+
+
+def _deferred_auto_now(
+    baker: "Baker", quantity: int
+) -> contextlib.AbstractContextManager:
+    """Apply the `auto_now` overrides of many instances at once, if supported."""
+    if quantity > 1 and isinstance(baker, Baker):
+        return baker._defer_auto_now()
+    return contextlib.nullcontext()
+
+
 def _is_auto_datetime_field(field: Field) -> bool:
     return getattr(field, "auto_now_add", False) or getattr(field, "auto_now", False)
 
@@ -91,6 +126,33 @@ def seed(seed: int | float | str | bytes | bytearray | None) -> None:
     Baker.seed(seed)
 
 
+def random_stream(key: Hashable) -> contextlib.AbstractContextManager:
+    """Generate the random values of the current thread or task from their own stream.
+
+    Streams are derived from `key` and the seed given to `seed()`, so each
+    thread or task making objects in its own stream gets reproducible values.
+    """
+    return random_gen.random_stream(key)
+
+
+def reset_sequences() -> None:
+    """Restart the iterators of all recipes, e.g. `seq()`, from their first value.
+
+    This also happens whenever the database is flushed or migrated.
+    """
+    from .recipe import _reset_sequences
+
+    _reset_sequences()
+
+
+def clear_in_memory_files() -> None:
+    """Drop the files kept in memory with the `BAKER_IN_MEMORY_FILES` setting.
+
+    This also happens whenever the setting is changed.
+    """
+    _in_memory_storage.cache_clear()
+
+
 @overload
 def make(
     _model: str | type[M],
@@ -160,15 +222,26 @@ def make(
 
     full_clean_kwargs = {"_full_clean": True} if _full_clean else {}
     if _quantity:
-        return [
-            baker.make(
-                _save_kwargs=_save_kwargs,
-                _refresh_after_create=_refresh_after_create,
-                **full_clean_kwargs,
-                **attrs,
-            )
-            for _ in range(_quantity)
-        ]
+        _from_manager = attrs.pop("_from_manager", None)
+        with (
+            _batched(baker, _quantity, True, attrs),
+            _deferred_auto_now(baker, _quantity),
+        ):
+            instances = [
+                baker.make(
+                    _save_kwargs=_save_kwargs,
+                    **full_clean_kwargs,
+                    **attrs,
+                )
+                for _ in range(_quantity)
+            ]
+
+        # fetch all instances at once, after the `auto_now` overrides
+        if _from_manager:
+            return _fetch_from_manager(baker.model, _from_manager, instances)
+        if _refresh_after_create:
+            _refresh_from_db(baker.model, instances)
+        return instances
 
     return baker.make(
         _save_kwargs=_save_kwargs,
@@ -222,22 +295,69 @@ def prepare(
 
     full_clean_kwargs = {"_full_clean": True} if _full_clean else {}
     if _quantity:
-        return [
-            baker.prepare(_save_related=_save_related, **full_clean_kwargs, **attrs)
-            for i in range(_quantity)
-        ]
+        with _batched(baker, _quantity, _save_related, attrs):
+            return [
+                baker.prepare(_save_related=_save_related, **full_clean_kwargs, **attrs)
+                for i in range(_quantity)
+            ]
 
     return baker.prepare(_save_related=_save_related, **full_clean_kwargs, **attrs)
 
 
+# recipes resolved by `_recipe`, keyed by the name they were looked up with
+_recipes: dict[str, Any] = {}
+
+# recipes found by `autodiscover_recipes`, by model and then by name
+_recipes_by_model: dict[type[Model], dict[str, Any]] = {}
+
+
 def _recipe(name: str) -> Any:
+    try:
+        return _recipes[name]
+    except KeyError:
+        pass
     app_name, recipe_name = name.rsplit(".", 1)
     try:
         module = apps.get_app_config(app_name).module
         pkg = module.__package__ if module else app_name
     except LookupError:
         pkg = app_name
-    return import_from_str(".".join((pkg, "baker_recipes", recipe_name)))
+    recipe = _recipes[name] = import_from_str(
+        ".".join((pkg, "baker_recipes", recipe_name))
+    )
+    return recipe
+
+
+def autodiscover_recipes() -> None:
+    """Import the `baker_recipes` module of every installed app and index its recipes.
+
+    The recipes are then found by `make_recipe` and `prepare_recipe` without
+    importing anything, and are listed by `get_recipes_for_model`.
+    """
+    from .recipe import Recipe
+
+    finder = ModelFinder()
+    for app_config in apps.get_app_configs():
+        if not module_has_submodule(app_config.module, "baker_recipes"):
+            continue
+        module = importlib.import_module(f"{app_config.name}.baker_recipes")
+        for recipe_name, recipe in vars(module).items():
+            # recipes imported from another module are indexed with it
+            if not isinstance(recipe, Recipe) or recipe._module != module.__name__:
+                continue
+            name = f"{app_config.label}.{recipe_name}"
+            _recipes[name] = _recipes[f"{app_config.name}.{recipe_name}"] = recipe
+            model = recipe._model
+            if isinstance(model, str):
+                model = finder.get_model(model)
+            _recipes_by_model.setdefault(model, {})[name] = recipe
+
+
+def get_recipes_for_model(model: str | type[Model]) -> dict[str, Any]:
+    """Return the recipes of `model` found by `autodiscover_recipes`, by name."""
+    if isinstance(model, str):
+        model = ModelFinder().get_model(model)
+    return dict(_recipes_by_model.get(model, {}))
 
 
 def make_recipe(baker_recipe_name, _quantity=None, _using="", **new_attrs):
@@ -339,6 +459,12 @@ def accepts_kwarg(callable_: Callable, name: str) -> bool:
     )
 
 
+# Values derived from settings, keyed by setting name. Each entry keeps the
+# setting value it was derived from, so settings assigned without firing
+# `setting_changed` are still picked up.
+_settings_cache: dict[str, tuple[Any, Any]] = {}
+
+
 def _custom_baker_class() -> type | None:
     """Return the specified custom baker class.
 
@@ -348,11 +474,19 @@ def _custom_baker_class() -> type | None:
 
     """
     custom_class_string = getattr(settings, "BAKER_CUSTOM_CLASS", None)
-    if custom_class_string is None:
-        return None
+    cached = _settings_cache.get("BAKER_CUSTOM_CLASS")
+    if cached is not None and cached[0] is custom_class_string:
+        return cached[1]
 
-    try:
-        baker_class = import_from_str(custom_class_string)
+    if custom_class_string is None:
+        baker_class = None
+    else:
+        try:
+            baker_class = import_from_str(custom_class_string)
+        except ImportError:
+            raise CustomBakerNotFound(
+                f"Could not find custom baker class '{custom_class_string}'"
+            )
 
         for required_function_name in ("make", "prepare"):
             if not hasattr(baker_class, required_function_name):
@@ -360,13 +494,153 @@ def _custom_baker_class() -> type | None:
                     f'Custom Baker classes must have a "{required_function_name}" function'
                 )
 
-        return baker_class
-    except ImportError:
-        raise CustomBakerNotFound(
-            f"Could not find custom baker class '{custom_class_string}'"
+    _settings_cache["BAKER_CUSTOM_CLASS"] = (custom_class_string, baker_class)
+    return baker_class
+
+
+def _batch_backend() -> Callable | None:
+    """Return the backend providing column generators for many instances.
+
+    It is BAKER_BATCH_BACKEND in Django's settings, a callable (or its dotted
+    path) receiving a generator and the quantity to make, and returning a
+    `batch` callable to use instead of the generator's own, or None. When the
+    setting isn't defined, NumPy backs the common generators if installed; a
+    falsy value disables the backend.
+    """
+    backend_string = getattr(settings, "BAKER_BATCH_BACKEND", None)
+    cached = _settings_cache.get("BAKER_BATCH_BACKEND")
+    if cached is not None and cached[0] is backend_string:
+        return cached[1]
+
+    if backend_string is None:
+        backend = numpy_gen.get_batch if numpy_gen.BAKER_NUMPY else None
+    elif not backend_string:
+        backend = None
+    else:
+        backend = import_from_str(backend_string)
+
+    _settings_cache["BAKER_BATCH_BACKEND"] = (backend_string, backend)
+    return backend
+
+
+@functools.cache
+def _in_memory_storage() -> InMemoryStorage:
+    return InMemoryStorage()
+
+
+def _keep_files_in_memory(instance: Model, fields: list[FileField]) -> None:
+    """Store the generated files of `instance` in memory instead of its storage.
+
+    The files are saved to a shared `InMemoryStorage` and marked as committed,
+    so saving the instance doesn't write them to the field's storage.
+    """
+    storage = _in_memory_storage()
+    for field in fields:
+        field_file = getattr(instance, field.attname)
+        if not field_file or field_file._committed:
+            continue
+        name = field.generate_filename(instance, field_file.name)
+        in_memory_file = field.attr_class(
+            instance, field, storage.save(name, field_file.file)
+        )
+        in_memory_file.storage = storage
+        setattr(instance, field.attname, in_memory_file)
+
+
+def _type_mapping() -> dict[type, Callable]:
+    """Return the default type mapping updated with `BAKER_CUSTOM_FIELDS_GEN`.
+
+    The returned mapping is shared, copy it before changing it.
+    """
+    generators_from_settings = getattr(settings, "BAKER_CUSTOM_FIELDS_GEN", None)
+    cached = _settings_cache.get("BAKER_CUSTOM_FIELDS_GEN")
+    if cached is not None and cached[0] is generators_from_settings:
+        return cached[1]
+
+    type_mapping = generators.get_type_mapping()
+    for k, v in (generators_from_settings or {}).items():
+        field_class = import_from_str(k)
+        generator = import_from_str(v)
+        type_mapping[field_class] = generator
+
+    if cached is not None:
+        # the setting was replaced without `setting_changed` being sent
+        clear_bake_plans()
+    _settings_cache["BAKER_CUSTOM_FIELDS_GEN"] = (
+        generators_from_settings,
+        type_mapping,
+    )
+    return type_mapping
+
+
+# generators of the fields with choices, along with the choices they were
+# compiled from
+_choices_generators: dict[Field, tuple[Any, Callable]] = {}
+
+
+def _has_callable_choices(field: Field) -> bool:
+    # the callable may return other choices every time it's evaluated
+    return isinstance(field.choices, CallableChoiceIterator)
+
+
+def _choices_generator(field: Field) -> Callable:
+    """Return the generator picking among the choices of `field`, built once.
+
+    Choices given by a callable are evaluated again for every new generator.
+    """
+    cached = _choices_generators.get(field)
+    if cached is not None and cached[0] is field.choices:
+        return cached[1]
+
+    generator = random_gen.gen_from_choices(
+        field.choices, nullable=field.null, blankable=field.blank
+    )
+    if not _has_callable_choices(field):
+        _choices_generators[field] = (field.choices, generator)
+    return generator
+
+
+class _GeneratorPlan:
+    """A generator resolved for a field, along with its precomputed arguments."""
+
+    __slots__ = (
+        "generator",
+        "generator_attrs",
+        "is_relation",
+        "required",
+        "source",
+        "volatile",
+    )
+
+    def __init__(
+        self,
+        generator: Callable,
+        generator_attrs: dict[str, Any] | None = None,
+        is_relation: bool = False,
+        source: Callable | None = None,
+        volatile: bool = False,
+    ) -> None:
+        self.generator = generator
+        self.generator_attrs = generator_attrs or {}
+        self.is_relation = is_relation
+        # the generator must be resolved again for every value
+        self.volatile = volatile
+        # keep the `required` the arguments were computed from, so changing it
+        # on the generator after the fact is still honored
+        self.source = source
+        self.required = getattr(source, "required", ())
+
+    def is_stale(self) -> bool:
+        return self.volatile or (
+            self.source is not None
+            and getattr(self.source, "required", ()) is not self.required
         )
 
 
+def _constant(value: Any) -> Callable[[], Any]:
+    return lambda: value
+
+
 class Baker(Generic[M]):
     SENTINEL = object()
 
@@ -379,6 +653,9 @@ class Baker(Generic[M]):
     # rebuilding the model cache for every make_* or prepare_* call.
     finder = ModelFinder()
 
+    # Compiled bake plans shared by all Baker instances, see `_bake_plan()`.
+    _bake_plans: dict[tuple, tuple[tuple[Any, _GeneratorPlan | None], ...]] = {}
+
     @classmethod
     def seed(cls, seed: int | float | str | bytes | bytearray | None) -> None:
         random_gen.baker_random.seed(seed)
@@ -413,6 +690,9 @@ class Baker(Generic[M]):
         self.rel_attrs: dict[str, Any] = {}
         self.rel_fields: list[str] = []
         self._using = _using
+        self._batched_values: dict[str, Iterator] = {}
+        self._generated_files: list[FileField] = []
+        self._deferred_auto_now: list[tuple[Model, dict[str, Any]]] | None = None
 
         if isinstance(_model, str):
             self.model = cast(type[M], self.finder.get_model(_model))
@@ -422,12 +702,8 @@ class Baker(Generic[M]):
         self.init_type_mapping()
 
     def init_type_mapping(self) -> None:
-        self.type_mapping = generators.get_type_mapping()
-        generators_from_settings = getattr(settings, "BAKER_CUSTOM_FIELDS_GEN", {})
-        for k, v in generators_from_settings.items():
-            field_class = import_from_str(k)
-            generator = import_from_str(v)
-            self.type_mapping[field_class] = generator
+        self._default_type_mapping = _type_mapping()
+        self.type_mapping = self._default_type_mapping.copy()
 
     def make(
         self,
@@ -490,15 +766,13 @@ class Baker(Generic[M]):
             _save_kwargs["using"] = self._using
 
         self._clean_attrs(attrs)
+        self._generated_files = []
         generate_value_kwargs = (
             {"_full_clean": True}
             if _full_clean and accepts_kwarg(self.generate_value, "_full_clean")
             else {}
         )
-        for field in self.get_fields():
-            if self._skip_field(field):
-                continue
-
+        for field, generator_plan in self._bake_plan(commit_related):
             if isinstance(field, ManyToManyField):
                 if field.name not in self.model_attrs:
                     self.m2m_dict[field.name] = self.m2m_value(field)
@@ -524,11 +798,22 @@ class Baker(Generic[M]):
                     or hasattr(field, "attname")
                     and field.attname not in self.model_attrs
                 ):
-                    self.model_attrs[field.name] = self.generate_value(
-                        field,
-                        commit_related,
-                        **generate_value_kwargs,
-                    )
+                    if isinstance(field, FileField):
+                        self._generated_files.append(field)
+                    if generator_plan is None:
+                        self.model_attrs[field.name] = self.generate_value(
+                            field,
+                            commit_related,
+                            **generate_value_kwargs,
+                        )
+                    elif field.name in self._batched_values:
+                        self.model_attrs[field.name] = next(
+                            self._batched_values[field.name]
+                        )
+                    else:
+                        self.model_attrs[field.name] = self._call_generator(
+                            field, generator_plan, commit_related, _full_clean
+                        )
             elif callable(self.model_attrs[field.name]):
                 self.model_attrs[field.name] = self.model_attrs[field.name]()
             elif field.name in self.iterator_attrs:
@@ -553,10 +838,125 @@ class Baker(Generic[M]):
 
         return instance
 
+    def _bake_plan(self, commit: bool) -> tuple[tuple[Any, _GeneratorPlan | None], ...]:
+        """Return the fields to fill, each with the generator to fill it with.
+
+        Which fields get skipped and which generator fills the others only
+        depend on the model, the baking flags and the names of the given attrs,
+        so the plan is compiled once and shared by every Baker making the same
+        kind of call. Fields given a value (or handled by a custom
+        `generate_value()`) are planned without a generator.
+        """
+        fill_in_optional = self.fill_in_optional
+        if not isinstance(fill_in_optional, bool):
+            fill_in_optional = frozenset(fill_in_optional)
+        mapping_overrides = self._mapping_overrides()
+        key = (
+            type(self),
+            mapping_overrides,
+            self.model,
+            commit,
+            fill_in_optional,
+            self.create_files,
+            self.make_m2m,
+            self._using,
+            frozenset(self.model_attrs),
+            frozenset(self.iterator_attrs),
+            frozenset(self.rel_fields),
+        )
+        try:
+            return self._bake_plans[key]
+        except KeyError:
+            pass
+
+        resolve_generators = type(self).generate_value is Baker.generate_value
+        plan = []
+        for field in self.get_fields():
+            if self._skip_field(field):
+                continue
+
+            generator_plan = None
+            if resolve_generators and self._needs_generated_value(field):
+                generator_plan = self._resolve_generator(field, commit)
+            plan.append((field, generator_plan))
+
+        plan = tuple(plan)
+        if mapping_overrides is not None:
+            self._bake_plans[key] = plan
+        return plan
+
+    def _mapping_overrides(self) -> tuple[frozenset, ...] | None:
+        """Return the generators mapped on this very instance, as a plan key.
+
+        Returns None if they can't be used as a key, so the plan isn't shared.
+        """
+        overrides = []
+        if "attr_mapping" in self.__dict__:
+            overrides.append(self.attr_mapping.items())
+        if self.type_mapping != getattr(self, "_default_type_mapping", None):
+            overrides.append(self.type_mapping.items())
+
+        try:
+            return tuple(frozenset(items) for items in overrides)
+        except TypeError:
+            return None
+
+    @contextlib.contextmanager
+    def _generate_in_batches(
+        self, quantity: int, commit: bool, attrs: dict[str, Any]
+    ) -> Iterator[None]:
+        """Pre-generate the values of `quantity` instances column by column.
+
+        Fields whose generator has a `batch` attribute, or one provided by the
+        batch backend, get all their values from a single
+        `batch(quantity, **required)` call, consumed by the following
+        `quantity` calls to `_make()` with the same `attrs`.
+        """
+        self._clean_attrs(attrs.copy())
+        backend = _batch_backend()
+        for field, generator_plan in self._bake_plan(commit):
+            if (
+                generator_plan is None
+                or generator_plan.is_stale()
+                or field.name in self.rel_fields
+            ):
+                continue
+
+            batch = backend and backend(generator_plan.generator, quantity)
+            if batch is None:
+                batch = getattr(generator_plan.generator, "batch", None)
+            if batch is not None:
+                self._batched_values[field.name] = iter(
+                    batch(quantity, **generator_plan.generator_attrs)
+                )
+
+        try:
+            yield
+        finally:
+            self._batched_values = {}
+
+    def _needs_generated_value(self, field: Field) -> bool:
+        """Return whether `_make()` fills the field from a generator."""
+        if isinstance(field, ManyToManyField) or field.name in self.model_attrs:
+            return False
+
+        if isinstance(field, (OneToOneField, ForeignKey)) and hasattr(field, "attname"):
+            return (
+                field.attname not in self.iterator_attrs
+                and field.attname not in self.model_attrs
+            )
+
+        return not isinstance(field, ForeignKey)
+
+    def _is_fill_optional(self, field: Field) -> bool:
+        if isinstance(self.fill_in_optional, bool):
+            return self.fill_in_optional
+        return field.name in self.fill_in_optional
+
     def m2m_value(self, field: ManyToManyField) -> list[Any]:
         if field.name in self.rel_fields:
             return self.generate_value(field)
-        if not self.make_m2m or field.null and not field.fill_optional:
+        if not self.make_m2m or field.null and not self._is_fill_optional(field):
             return []
         return self.generate_value(field)
 
@@ -617,6 +1017,8 @@ class Baker(Generic[M]):
         instance = self.model(**attrs)
         if using := _save_kwargs.get("using"):
             instance._state.db = using
+        if self._generated_files and getattr(settings, "BAKER_IN_MEMORY_FILES", False):
+            _keep_files_in_memory(instance, self._generated_files)
 
         self._handle_generic_foreign_keys(
             instance, generic_foreign_keys, commit=_commit
@@ -678,11 +1080,7 @@ class Baker(Generic[M]):
         self.rel_fields = [x.split("__")[0] for x in self.rel_attrs if is_rel_field(x)]
 
     def _skip_field(self, field: Field) -> bool:  # noqa: C901
-        # check for fill optional argument
-        if isinstance(self.fill_in_optional, bool):
-            field.fill_optional = self.fill_in_optional
-        else:
-            field.fill_optional = field.name in self.fill_in_optional
+        fill_optional = self._is_fill_optional(field)
 
         if isinstance(field, FileField) and not self.create_files:
             return True
@@ -728,7 +1126,7 @@ class Baker(Generic[M]):
         ):
             # Django is quirky in that BooleanFields are always "blank",
             # but have no default.
-            if not field.fill_optional and (
+            if not fill_optional and (
                 not issubclass(field.__class__, Field)
                 or field.has_default()
                 or (field.blank and not isinstance(field, BooleanField))
@@ -736,9 +1134,7 @@ class Baker(Generic[M]):
                 return True
 
         if field.name not in self.model_attrs:  # noqa: SIM102
-            if field.name not in self.rel_fields and (
-                not field.fill_optional and field.null
-            ):
+            if field.name not in self.rel_fields and (not fill_optional and field.null):
                 return True
 
         return False
@@ -747,12 +1143,24 @@ class Baker(Generic[M]):
         if not attrs:
             return
 
-        # use .update() to force update auto_now fields
-        instance.__class__.objects.filter(pk=instance.pk).update(**attrs)
+        if self._deferred_auto_now is not None:
+            self._deferred_auto_now.append((instance, attrs))
+        else:
+            _update_auto_now(self.model, [(instance, attrs)])
 
-        # to make the resulting instance has the specified values
-        for k, v in attrs.items():
-            setattr(instance, k, v)
+    @contextlib.contextmanager
+    def _defer_auto_now(self) -> Iterator[None]:
+        """Collect the `auto_now` overrides of the instances made meanwhile.
+
+        They are applied together on exit, instead of with one UPDATE per
+        instance.
+        """
+        self._deferred_auto_now = []
+        try:
+            yield
+            _update_auto_now(self.model, self._deferred_auto_now)
+        finally:
+            self._deferred_auto_now = None
 
     def _handle_one_to_many(self, instance: Model, attrs: dict[str, Any]):
         """Handle reverse one-to-many relationships.
@@ -849,12 +1257,15 @@ class Baker(Generic[M]):
                     setattr(
                         instance,
                         ct_field_name,
-                        contenttypes_models.ContentType.objects.get_for_model(
-                            value, for_concrete_model=data["for_concrete_model"]
+                        get_content_type(
+                            value,
+                            for_concrete_model=data["for_concrete_model"],
+                            using=self._using,
                         ),
                     )
                 else:
-                    # prepare mode - create unsaved ContentType to avoid DB access.
+                    # prepare mode - use the already resolved ContentType or create an
+                    # unsaved one to avoid DB access.
                     # We deliberately skip setting content_object via the GFK descriptor
                     # because GenericForeignKey.__set__ calls ContentType.objects.get_for_model().
                     # As a result, instance.content_object will return None (the GFK descriptor
@@ -864,7 +1275,9 @@ class Baker(Generic[M]):
                         if data["for_concrete_model"]
                         else value.__class__
                     )
-                    ct = contenttypes_models.ContentType(
+                    ct = get_cached_content_type(
+                        model_for_ct, for_concrete_model=False, using=self._using
+                    ) or contenttypes_models.ContentType(
                         app_label=model_for_ct._meta.app_label,
                         model=model_for_ct._meta.model_name,
                     )
@@ -876,7 +1289,7 @@ class Baker(Generic[M]):
     ) -> OneToOneRel | ManyToOneRel:
         return cast(OneToOneRel | ManyToOneRel, field.remote_field)
 
-    def generate_value(  # noqa: C901
+    def generate_value(
         self, field: Field, commit: bool = True, _full_clean: bool = False
     ) -> Any:
         """Call the associated generator with a field passing all required args.
@@ -893,8 +1306,17 @@ class Baker(Generic[M]):
         `attr_mapping` and `type_mapping` can be defined easily overwriting the
         model.
         """
+        return self._call_generator(
+            field, self._resolve_generator(field, commit), commit, _full_clean
+        )
+
+    def _resolve_generator(  # noqa: C901
+        self, field: Field, commit: bool = True
+    ) -> _GeneratorPlan:
+        """Resolve the generator for a field, see `generate_value()`."""
         is_content_type_fk = False
         is_generic_fk = False
+        volatile = False
         if BAKER_CONTENTTYPES:
             is_content_type_fk = isinstance(field, ForeignKey) and issubclass(
                 self._remote_field(field).model, contenttypes_models.ContentType
@@ -905,16 +1327,15 @@ class Baker(Generic[M]):
         # we only use default unless the field is overwritten in `self.rel_fields`
         elif field.has_default() and field.name not in self.rel_fields:
             if callable(field.default):
-                return field.default()
-            return field.default
+                return _GeneratorPlan(field.default)
+            return _GeneratorPlan(_constant(field.default))
         elif getattr(field, "db_default", NOT_PROVIDED) != NOT_PROVIDED:
-            return field.db_default
+            return _GeneratorPlan(_constant(field.db_default))
         elif field.name in self.attr_mapping:
             generator = self.attr_mapping[field.name]
         elif field.choices:
-            generator = random_gen.gen_from_choices(
-                field.choices, nullable=field.null, blankable=field.blank
-            )
+            generator = _choices_generator(field)
+            volatile = _has_callable_choices(field)
         elif is_content_type_fk:
             generator = self.type_mapping[contenttypes_models.ContentType]
         elif gen := generators.get(field.__class__):
@@ -928,35 +1349,69 @@ class Baker(Generic[M]):
 
         # attributes like max_length, decimal_places are taken into account when
         # generating the value.
-        field._using = self._using
-        generator_attrs = get_required_values(generator, field)
+        generator_attrs = get_required_values(generator, field, _using=self._using)
 
-        if field.name in self.rel_fields:
-            generator_attrs.update(filter_rel_attrs(field.name, **self.rel_attrs))
-
-        if (
+        is_relation = (
             field.__class__ in (ForeignKey, OneToOneField, ManyToManyField)
             and not is_content_type_fk
-        ):
+        )
+        if is_relation:
             # create files also on related models if required
             generator_attrs["_create_files"] = self.create_files
-            if _full_clean:
-                generator_attrs["_full_clean"] = True
 
+        source = generator
         if not commit:
             generator = getattr(generator, "prepare", generator)
 
-        return generator(**generator_attrs)
+        return _GeneratorPlan(generator, generator_attrs, is_relation, source, volatile)
+
+    def _call_generator(
+        self,
+        field: Field,
+        generator_plan: _GeneratorPlan,
+        commit: bool = True,
+        _full_clean: bool = False,
+    ) -> Any:
+        if generator_plan.is_stale():
+            generator_plan = self._resolve_generator(field, commit)
+
+        generator_attrs = generator_plan.generator_attrs
+        if field.name in self.rel_fields or _full_clean and generator_plan.is_relation:
+            generator_attrs = generator_attrs.copy()
+            if field.name in self.rel_fields:
+                generator_attrs.update(filter_rel_attrs(field.name, **self.rel_attrs))
+            if _full_clean and generator_plan.is_relation:
+                generator_attrs["_full_clean"] = True
+
+        return generator_plan.generator(**generator_attrs)
+
+
+@receiver(setting_changed)
+def clear_bake_plans(**kwargs: Any) -> None:
+    """Drop compiled bake plans, e.g. when settings or generators change."""
+    Baker._bake_plans.clear()
+
+
+@receiver(setting_changed)
+def _clear_settings_cache(setting: str, **kwargs: Any) -> None:
+    _settings_cache.pop(setting, None)
+    if setting == "BAKER_IN_MEMORY_FILES":
+        clear_in_memory_files()
+    elif setting == "INSTALLED_APPS":
+        # recipe names are resolved against the installed apps
+        _recipes.clear()
+        _recipes_by_model.clear()
 
 
 def get_required_values(
-    generator: Callable, field: Field
+    generator: Callable, field: Field, **baking_values: Any
 ) -> dict[str, bool | int | str | list[Callable]]:
     """Get required values for a generator from the field.
 
     If required value is a function, calls it with field as argument. If
     required value is a string, simply fetch the value from the field
-    and return.
+    and return, unless it names one of the `baking_values` (e.g. `_using`),
+    which describe the current bake rather than the field.
     """
     required_values = {}  # type: dict[str, Any]
     for item in cast(Iterable[Any], getattr(generator, "required", ())):
@@ -965,7 +1420,10 @@ def get_required_values(
             required_values[key] = value
 
         elif isinstance(item, str):
-            required_values[item] = getattr(field, item)
+            if item in baking_values:
+                required_values[item] = baking_values[item]
+            else:
+                required_values[item] = getattr(field, item)
 
         else:
             raise ValueError(
@@ -989,36 +1447,252 @@ def filter_rel_attrs(field_name: str, **rel_attrs) -> dict[str, Any]:
     return clean_dict
 
 
+def _can_bulk_insert(model: type[Model], using: str) -> bool:
+    """Return whether `bulk_create()` can insert `model` rows and set their PKs."""
+    return (
+        not model._meta.concrete_model._meta.parents
+        and not model._meta.order_with_respect_to
+        and connections[using].features.can_return_rows_from_bulk_insert
+    )
+
+
+def _bulk_save(model, objects, _using=None, _full_clean=False) -> None:
+    """Persist unsaved `objects` of `model`, with one query if the backend allows it."""
+    using = _using or router.db_for_write(model)
+    for obj in objects:
+        if _using:
+            obj._state.db = _using
+        if _full_clean:
+            obj.full_clean()
+
+    if len(objects) > 1 and _can_bulk_insert(model, using):
+        model._base_manager.using(using).bulk_create(objects)
+    else:
+        _save_kwargs = {"using": _using} if _using else {}
+        for obj in objects:
+            obj.save(**_save_kwargs)
+
+
 def _save_related_objs(model, objects, _using=None, _full_clean=False) -> None:
-    """Recursively save all related foreign keys for each entry."""
-    _save_kwargs = {"using": _using} if _using else {}
+    """Recursively save all related foreign keys for each entry.
 
+    The dependency tree is persisted bottom-up: the unsaved targets of each
+    level are saved after their own foreign keys, with one bulk insert per
+    related model.
+    """
     fk_fields = [
         f for f in model._meta.fields if isinstance(f, (OneToOneField, ForeignKey))
     ]
 
+    fk_targets = []
+    unsaved_by_model: dict[type[Model], dict[int, Model]] = {}
     for fk in fk_fields:
-        fk_targets = []
         for obj in objects:
             fk_obj = getattr(obj, fk.name, None)
             if fk_obj and not fk_obj.pk:
-                fk_targets.append((obj, fk_obj))
+                fk_targets.append((obj, fk.name, fk_obj))
+                # the same unsaved object may be the target of many entries
+                unsaved_by_model.setdefault(type(fk_obj), {})[id(fk_obj)] = fk_obj
+
+    if not fk_targets:
+        return
+
+    for related_model, related_objs in unsaved_by_model.items():
+        fk_objects = list(related_objs.values())
+        _save_related_objs(
+            related_model,
+            fk_objects,
+            _using=_using,
+            _full_clean=_full_clean,
+        )
+        _bulk_save(
+            related_model,
+            # objects may already be saved as targets of a deeper level
+            [fk_obj for fk_obj in fk_objects if not fk_obj.pk],
+            _using=_using,
+            _full_clean=_full_clean,
+        )
 
-        if fk_targets:
-            fk_objects = [fk_obj for _, fk_obj in fk_targets]
-            _save_related_objs(
-                fk.related_model,
-                fk_objects,
-                _using=_using,
-                _full_clean=_full_clean,
+    for obj, fk_name, fk_obj in fk_targets:
+        setattr(obj, fk_name, fk_obj)
+
+
+def _fetch_from_manager(
+    model: type[M], manager_name: str, instances: list[M]
+) -> list[M]:
+    """Fetch `instances` again through the given manager, with one query.
+
+    Like `manager.get()` on each instance, this runs any code within the
+    manager's `get_queryset()`, e.g. annotations.
+    """
+    manager = getattr(model, manager_name)
+    fetched = manager.in_bulk([instance.pk for instance in instances])
+    try:
+        return [fetched[instance.pk] for instance in instances]
+    except KeyError:
+        raise model.DoesNotExist(
+            f"{model._meta.object_name} matching query does not exist."
+        ) from None
+
+
+def _refresh_from_db(model: type[Model], instances: list[Model]) -> None:
+    """Reload the field values of `instances`, with one query per database.
+
+    Like `Model.refresh_from_db()`, the instances are updated in place and
+    their cached relations are cleared.
+    """
+    by_db: dict[str | None, list[Model]] = {}
+    for instance in instances:
+        by_db.setdefault(instance._state.db, []).append(instance)
+
+    for using, db_instances in by_db.items():
+        fetched = model._base_manager.db_manager(using).in_bulk(
+            [instance.pk for instance in db_instances]
+        )
+        for instance in db_instances:
+            try:
+                db_instance = fetched[instance.pk]
+            except KeyError:
+                raise model.DoesNotExist(
+                    f"{model._meta.object_name} matching query does not exist."
+                ) from None
+            for field in model._meta.concrete_fields:
+                setattr(instance, field.attname, getattr(db_instance, field.attname))
+                if field.is_relation and field.is_cached(instance):
+                    field.delete_cached_value(instance)
+            for field in (*model._meta.related_objects, *model._meta.private_fields):
+                if field.is_relation and field.is_cached(instance):
+                    field.delete_cached_value(instance)
+            instance._state.db = db_instance._state.db
+
+
+def _update_auto_now(
+    model: type[Model], overrides: list[tuple[Model, dict[str, Any]]]
+) -> None:
+    """Force the given values of `auto_now`/`auto_now_add` fields into the db.
+
+    Django overwrites these fields on save, so they are written afterwards:
+    with one UPDATE when all instances share the same values, or with one
+    `bulk_update()` otherwise.
+    """
+    by_db: dict[str | None, list[tuple[Model, dict[str, Any]]]] = {}
+    for instance, attrs in overrides:
+        # make the resulting instances have the specified values
+        for k, v in attrs.items():
+            setattr(instance, k, v)
+        by_db.setdefault(instance._state.db, []).append((instance, attrs))
+
+    for using, db_overrides in by_db.items():
+        queryset = model._base_manager.using(using)
+        first_attrs = db_overrides[0][1]
+        instances = [instance for instance, _attrs in db_overrides]
+        if all(attrs == first_attrs for _instance, attrs in db_overrides):
+            queryset.filter(pk__in=[instance.pk for instance in instances]).update(
+                **first_attrs
             )
-            for obj, fk_obj in fk_targets:
-                if _using:
-                    fk_obj._state.db = _using
-                if _full_clean:
-                    fk_obj.full_clean()
-                fk_obj.save(**_save_kwargs)
-                setattr(obj, fk.name, fk_obj)
+        else:
+            fields = {name for _instance, attrs in db_overrides for name in attrs}
+            queryset.bulk_update(instances, fields)
+
+
+def _bulk_create_through_rows(
+    through_rows: dict[type[Model], list[Model]], _using: str = ""
+) -> None:
+    """Insert many-to-many through rows with one `bulk_create` per through model.
+
+    Django splits each insert into batches sized for the database backend.
+    """
+    for through_model, rows in through_rows.items():
+        if rows:
+            through_model._base_manager.using(_using or None).bulk_create(rows)
+
+
+def _bulk_save_m2m_targets(values: list[Model], _using: str = "") -> None:
+    """Save the unsaved many-to-many `values`, with one insert per model."""
+    unsaved_by_model: dict[type[Model], list[Model]] = {}
+    for value in values:
+        if not value.pk:
+            unsaved_by_model.setdefault(type(value), []).append(value)
+    for model, unsaved in unsaved_by_model.items():
+        _bulk_save(model, unsaved, _using=_using)
+
+
+def _bulk_make_through_rows(
+    through: type[Model],
+    source_field_name: str,
+    target_field_name: str,
+    entries: list[Model],
+    values: list[Model],
+    _using: str = "",
+) -> None:
+    """Make the rows of a custom `through` model, with their extra fields generated.
+
+    The rows are bulk created when Django can, and saved one by one otherwise.
+    """
+    if not entries or not values:
+        return
+    using = _using or router.db_for_write(through)
+    make(  # ty: ignore[no-matching-overload]
+        through,
+        _quantity=len(entries) * len(values),
+        _using=_using,
+        _bulk_create=_can_bulk_insert(through, using),
+        **{
+            source_field_name: iter([entry for entry in entries for _ in values]),
+            target_field_name: iter([value for _ in entries for value in values]),
+        },
+    )
+
+
+def _bulk_set_one_to_many(
+    model: type[Model], entries: list[Model], _using: str = "", **attrs: Any
+) -> None:
+    """Persist the reverse foreign key values of the bulk created `entries`.
+
+    The `related()` recipes are made once for all the entries. Other values
+    are given to each entry in turn, as `make()` does, with unsaved children
+    inserted in bulk and saved ones moved with a single UPDATE. The entries
+    were just created, so they have no other children to detach.
+    """
+    import types
+
+    from .recipe import related
+
+    for rel in model._meta.related_objects:
+        values = attrs.get(rel.get_accessor_name())
+        if not rel.one_to_many or values is None:
+            continue
+        if isinstance(values, types.MethodType) and isinstance(
+            values.__self__, related
+        ):
+            values.__self__.bulk_make(rel.field.name, entries, _using=_using)
+        elif not callable(values):
+            values = list(values)
+            for entry in entries:
+                _set_one_to_many(entry, rel.field, values, _using=_using)
+
+
+def _set_one_to_many(
+    instance: Model, fk_field: ForeignKey, values: list[Model], _using: str = ""
+) -> None:
+    """Point the reverse foreign key `values` at the new `instance` in bulk."""
+    fk_name = cast(str, fk_field.name)
+    unsaved, moved = [], []
+    for value in values:
+        if value._state.adding or not value.pk:
+            unsaved.append(value)
+        elif getattr(value, fk_field.attname) != getattr(
+            instance, fk_field.target_field.attname
+        ):
+            moved.append(value)
+        setattr(value, fk_name, instance)
+
+    if moved:
+        fk_field.model._base_manager.using(_using or None).filter(
+            pk__in=[value.pk for value in moved]
+        ).update(**{fk_name: instance})
+    if unsaved:
+        _bulk_save(fk_field.model, unsaved, _using=_using)
 
 
 def bulk_create(  # noqa: C901
@@ -1032,12 +1706,14 @@ def bulk_create(  # noqa: C901
     """
     # Create a list of entries by calling the prepare method of the Baker instance
     # quantity number of times, passing in the additional keyword arguments
-    entries = [
-        baker.prepare(
-            **kwargs,
-        )
-        for _ in range(quantity)
-    ]
+    attrs = {k: v for k, v in kwargs.items() if k != "_save_kwargs"}
+    with _batched(baker, quantity, False, attrs):
+        entries = [
+            baker.prepare(
+                **kwargs,
+            )
+            for _ in range(quantity)
+        ]
 
     # Use the desired database to create the entries
     if baker._using:
@@ -1045,6 +1721,20 @@ def bulk_create(  # noqa: C901
     else:
         manager = baker.model._base_manager
 
+    # Django overwrites `auto_now` fields on insert, so the given values are
+    # written again once the entries exist
+    auto_now_fields = [
+        field.name
+        for field in baker.model._meta.concrete_fields
+        if _is_auto_datetime_field(field) and field.name in kwargs
+    ]
+    auto_now_overrides: list[tuple[Model, dict[str, Any]]] = []
+    if auto_now_fields:
+        auto_now_overrides = [
+            (entry, {name: getattr(entry, name) for name in auto_now_fields})
+            for entry in entries
+        ]
+
     if _full_clean:
         with transaction.atomic(using=baker._using or None):
             _save_related_objs(
@@ -1060,34 +1750,65 @@ def bulk_create(  # noqa: C901
         _save_related_objs(baker.model, entries, _using=baker._using)
         created_entries = manager.bulk_create(entries)
 
+    # reverse foreign keys, e.g. the `related()` objects of recipes
+    _bulk_set_one_to_many(baker.model, created_entries, _using=baker._using, **kwargs)
+
+    # rows of all many-to-many relations from kwargs, inserted at once per
+    # through model by `_bulk_create_through_rows()`
+    through_rows: dict[type[Model], list[Model]] = {}
+
     # set many-to-many relations from kwargs
-    for entry in created_entries:
-        for field in baker.model._meta.many_to_many:
-            if field.name in kwargs:
-                through_model = getattr(entry, field.name).through
-                through_model.objects.bulk_create(
-                    [
-                        through_model(
+    for field in baker.model._meta.many_to_many:
+        if field.name in kwargs:
+            values = list(kwargs[field.name])
+            _bulk_save_m2m_targets(values, _using=baker._using)
+            through = field.remote_field.through
+            if not through._meta.auto_created:
+                _bulk_make_through_rows(
+                    through,
+                    field.m2m_field_name(),
+                    field.m2m_reverse_field_name(),
+                    created_entries,
+                    values,
+                    _using=baker._using,
+                )
+                continue
+            rows = through_rows.setdefault(through, [])
+            for entry in created_entries:
+                rows.extend(
+                    through(
+                        **{
+                            field.m2m_field_name(): entry,
+                            field.m2m_reverse_field_name(): obj,
+                        }
+                    )
+                    for obj in values
+                )
+
+    # set many-to-many relations that are specified using related name from kwargs
+    for field in baker.model._meta.get_fields():
+        if field.many_to_many and hasattr(field, "related_model"):
+            reverse_relation_name = (
+                field.related_query_name
+                or field.related_name
+                or f"{field.related_model._meta.model_name}_set"
+            )
+            if reverse_relation_name in kwargs:
+                m2m_field = field.field
+                values = list(kwargs[reverse_relation_name])
+                _bulk_save_m2m_targets(values, _using=baker._using)
+                # like `.set()`, relate each object only once
+                related_objs = {obj.pk: obj for obj in values}
+                rows = through_rows.setdefault(m2m_field.remote_field.through, [])
+                for entry in created_entries:
+                    rows.extend(
+                        m2m_field.remote_field.through(
                             **{
-                                field.m2m_field_name(): entry,
-                                field.m2m_reverse_field_name(): obj,
+                                m2m_field.m2m_field_name(): obj,
+                                m2m_field.m2m_reverse_field_name(): entry,
                             }
                         )
-                        for obj in kwargs[field.name]
-                    ]
-                )
-
-        # set many-to-many relations that are specified using related name from kwargs
-        for field in baker.model._meta.get_fields():
-            if field.many_to_many and hasattr(field, "related_model"):
-                reverse_relation_name = (
-                    field.related_query_name
-                    or field.related_name
-                    or f"{field.related_model._meta.model_name}_set"
-                )
-                if reverse_relation_name in kwargs:
-                    getattr(entry, reverse_relation_name).set(
-                        kwargs[reverse_relation_name]
+                        for obj in related_objs.values()
                     )
 
     # set M2M on FK-related objects (e.g. `home__dogs=[dog]`)
@@ -1116,11 +1837,11 @@ def bulk_create(  # noqa: C901
         through_model = related_m2m.remote_field.through
         if not through_model._meta.auto_created:
             continue
-        through_rows = []
+        rows = through_rows.setdefault(through_model, [])
         for entry in created_entries:
             fk_obj = getattr(entry, fk_field_name, None)
             if fk_obj is not None:
-                through_rows.extend(
+                rows.extend(
                     through_model(
                         **{
                             related_m2m.m2m_field_name(): fk_obj,
@@ -1129,7 +1850,10 @@ def bulk_create(  # noqa: C901
                     )
                     for obj in kwarg_value
                 )
-        if through_rows:
-            through_model.objects.bulk_create(through_rows)
+
+    _bulk_create_through_rows(through_rows, _using=baker._using)
+
+    if auto_now_overrides:
+        _update_auto_now(baker.model, auto_now_overrides)
 
     return created_entries
@@ -1,14 +1,79 @@
 from django.apps import apps
+from django.db import router
 
 BAKER_CONTENTTYPES = apps.is_installed("django.contrib.contenttypes")
 
 default_contenttypes_mapping = {}
 
-__all__ = ["BAKER_CONTENTTYPES", "default_contenttypes_mapping"]
+__all__ = [
+    "BAKER_CONTENTTYPES",
+    "clear_content_types_cache",
+    "default_contenttypes_mapping",
+    "get_cached_content_type",
+    "get_content_type",
+]
+
+# content types of all installed models per database alias, keyed by
+# `(app_label, model_name)`
+_content_types: dict = {}
+
+
+def clear_content_types_cache(**kwargs) -> None:
+    """Forget the content types resolved by baker, e.g. after migrations."""
+    _content_types.clear()
+
+
+def _get_content_types(using: str) -> dict:
+    from django.contrib.contenttypes.models import ContentType
+
+    content_types = _content_types.get(using)
+    if content_types is None:
+        content_types = ContentType.objects.db_manager(using).get_for_models(
+            *apps.get_models(), for_concrete_models=False
+        )
+        content_types = _content_types[using] = {
+            (content_type.app_label, content_type.model): content_type
+            for content_type in content_types.values()
+        }
+    return content_types
+
+
+def get_content_type(model, for_concrete_model: bool = True, using: str = ""):
+    """Return the `ContentType` of `model`, resolved once per database.
+
+    The content types of all installed models are fetched together on the
+    first call for a database.
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    using = using or router.db_for_read(ContentType)
+    opts = model._meta.concrete_model._meta if for_concrete_model else model._meta
+    content_types = _get_content_types(using)
+    try:
+        return content_types[(opts.app_label, opts.model_name)]
+    except KeyError:
+        content_type = ContentType.objects.db_manager(using).get_for_model(
+            model, for_concrete_model=for_concrete_model
+        )
+        content_types[(opts.app_label, opts.model_name)] = content_type
+        return content_type
+
+
+def get_cached_content_type(model, for_concrete_model: bool = True, using: str = ""):
+    """Return the `ContentType` of `model` if already resolved, without queries."""
+    from django.contrib.contenttypes.models import ContentType
+
+    using = using or router.db_for_read(ContentType)
+    opts = model._meta.concrete_model._meta if for_concrete_model else model._meta
+    return _content_types.get(using, {}).get((opts.app_label, opts.model_name))
+
 
 if BAKER_CONTENTTYPES:
     from django.contrib.contenttypes.models import ContentType
+    from django.db.models.signals import post_migrate
 
     from . import random_gen
 
     default_contenttypes_mapping[ContentType] = random_gen.gen_content_type
+
+    post_migrate.connect(clear_content_types_cache)
@@ -154,7 +154,10 @@ user_mapping = {}
 
 
 def add(field: str, func: Callable | str | None) -> None:
+    from .baker import clear_bake_plans
+
     user_mapping[import_from_str(field)] = import_from_str(func)
+    clear_bake_plans()
 
 
 def get(field: Any) -> Callable | None:
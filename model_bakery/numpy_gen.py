@@ -0,0 +1,97 @@
+"""Column generators backed by NumPy, for making many instances at once.
+
+When NumPy is installed and at least `NUMPY_MIN_QUANTITY` instances are made
+or bulk created, baker fills the columns of the generators below from a NumPy
+random `Generator` instead of calling them once per value. Everything else
+keeps using the generators of `random_gen` and their own `batch`.
+
+The `Generator` is seeded from `random_gen.baker_random`, so the columns are
+reproducible with `baker.seed()`.
+"""
+
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from . import random_gen
+
+try:
+    import numpy as np  # ty: ignore[unresolved-import]
+except ImportError:
+    np = None  # ty: ignore[invalid-assignment]
+
+BAKER_NUMPY = np is not None
+
+# below this quantity, setting up NumPy costs more than it saves
+NUMPY_MIN_QUANTITY = 1000
+
+__all__ = ["BAKER_NUMPY", "NUMPY_MIN_QUANTITY", "get_batch"]
+
+
+def _rng() -> "np.random.Generator":
+    return np.random.default_rng(random_gen.baker_random.getrandbits(64))
+
+
+def _random_integers(n: int, min_int: int, max_int: int) -> list[int]:
+    return (
+        _rng()
+        .integers(min_int, max_int, size=n, dtype=np.int64, endpoint=True)
+        .tolist()
+    )
+
+
+def _batch_integers(field_name: str) -> Callable[..., list[int]]:
+    return random_gen._batch_integers(field_name, _random_integers)
+
+
+def _batch_floats(
+    n: int, min_float: float = -1000000.0, max_float: float = 1000000.0
+) -> list[float]:
+    return _rng().uniform(min_float, max_float, size=n).tolist()
+
+
+def _batch_booleans(n: int) -> list[bool]:
+    return _rng().integers(0, 2, size=n).astype(bool).tolist()
+
+
+def _batch_null_booleans(n: int) -> list[bool | None]:
+    values = (True, False, None)
+    return [values[i] for i in _rng().integers(0, 3, size=n)]
+
+
+def _random_digits(k: int) -> str:
+    digits = _rng().integers(0, 10, size=k, dtype=np.uint8) + ord("0")
+    return digits.tobytes().decode("ascii")
+
+
+_batch_decimals = random_gen._batch_decimals(_random_digits)
+
+
+def _batch_uuids(n: int) -> list[UUID]:
+    data = _rng().bytes(16 * n)
+    return [UUID(bytes=data[i : i + 16], version=4) for i in range(0, 16 * n, 16)]
+
+
+_batch_generators: dict[Callable, Callable[..., list[Any]]] = {
+    random_gen.gen_small_integer: _batch_integers("SmallIntegerField"),
+    random_gen.gen_positive_small_integer: _batch_integers("PositiveSmallIntegerField"),
+    random_gen.gen_positive_integer: _batch_integers("PositiveIntegerField"),
+    random_gen.gen_big_integer: _batch_integers("BigIntegerField"),
+    random_gen.gen_positive_big_integer: _batch_integers("PositiveBigIntegerField"),
+    random_gen.gen_regular_integer: _batch_integers("IntegerField"),
+    random_gen.gen_float: _batch_floats,
+    random_gen.gen_boolean: _batch_booleans,
+    random_gen.gen_null_boolean: _batch_null_booleans,
+    random_gen.gen_decimal: _batch_decimals,
+    random_gen.gen_uuid: _batch_uuids,
+}
+
+
+def get_batch(generator: Callable, quantity: int) -> Callable[..., list[Any]] | None:
+    """Return the NumPy column generator replacing `generator`, if any.
+
+    This is the default `BAKER_BATCH_BACKEND` when NumPy is installed.
+    """
+    if not BAKER_NUMPY or quantity < NUMPY_MIN_QUANTITY:
+        return None
+    return _batch_generators.get(generator)
@@ -7,13 +7,23 @@ generator. If it is a callable (which will receive `field` as first
 argument), it should return a list in the format (key, value) where key
 is the argument name for generator and value is the value for that
 argument.
+
+A generator may also have a `batch` attribute: a callable receiving the
+number of values wanted plus the same required arguments, and returning
+that many values at once. Baker uses it to fill whole columns when making
+more than one instance.
 """
 
+import os
 import string
+import struct
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from functools import cache
 from os.path import abspath, dirname, join
 from random import Random
 from typing import Any
@@ -29,30 +39,154 @@ MAX_LENGTH = 300
 # Postgres database.
 MAX_INT = 100000000000
 
-baker_random = Random()  # noqa: S311
+# the random generator of contexts which did not start a `random_stream()`
+_root_random = Random()  # noqa: S311
+# the seed given to `_root_random`, which `random_stream()` derives from
+_root_seed: Any = None
+_random_stream: ContextVar[Random] = ContextVar("baker_random_stream")
+
+
+def _seed(a: Any = None, version: int = 2) -> None:
+    global _root_seed
+
+    stream = _random_stream.get(None)
+    if stream is None:
+        _root_seed = a
+        stream = _root_random
+    stream.seed(a, version)
+
+
+class _ContextRandom(Random):
+    """A `Random` generating values from the stream of the current context.
+
+    That is the stream started by `random_stream()` in the current thread or
+    asyncio task, or the root generator otherwise. Each method looks the
+    stream up once, then runs entirely on it.
+    """
+
+    def __init__(self) -> None:
+        # the streams hold the state, this generator has none of its own
+        pass
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        _seed(a, version)
+
+
+def _delegate(name: str) -> Callable[..., Any]:
+    def method(self: Random, *args: Any, **kwargs: Any) -> Any:
+        return getattr(_random_stream.get(_root_random), name)(*args, **kwargs)
+
+    method.__name__ = method.__qualname__ = name
+    method.__doc__ = getattr(Random, name).__doc__
+    return method
+
+
+for _name in (
+    "random",
+    "getrandbits",
+    "randbytes",
+    "getstate",
+    "setstate",
+    "_randbelow",
+    "randrange",
+    "randint",
+    "choice",
+    "choices",
+    "sample",
+    "shuffle",
+    "uniform",
+    "triangular",
+    "normalvariate",
+    "gauss",
+    "lognormvariate",
+    "expovariate",
+    "vonmisesvariate",
+    "gammavariate",
+    "betavariate",
+    "paretovariate",
+    "weibullvariate",
+    "binomialvariate",
+):
+    if hasattr(Random, _name):
+        setattr(_ContextRandom, _name, _delegate(_name))
+
+
+baker_random = _ContextRandom()
+
+
+@contextmanager
+def random_stream(key: Hashable) -> Iterator[Random]:
+    """Generate the random values of the current thread or task from a stream.
+
+    The stream is seeded from `key` and the seed given to `baker.seed()`, so
+    its values are reproducible however threads and tasks are scheduled.
+    Calling `baker.seed()` within the stream seeds the stream only.
+    """
+    seed = None if _root_seed is None else f"{_root_seed!r}:{key!r}"
+    token = _random_stream.set(Random(seed))  # noqa: S311
+    try:
+        yield _random_stream.get()
+    finally:
+        _random_stream.reset(token)
+
+
+@cache
+def _byte_translation(alphabet: str) -> tuple[bytes, bytes]:
+    """Map random bytes onto `alphabet`, uniformly.
+
+    Returns a `bytes.translate()` table sending each byte to a character of
+    `alphabet`, and the bytes to delete: those beyond the largest multiple
+    of `len(alphabet)`, which would favor its first characters.
+    """
+    usable = 256 - 256 % len(alphabet)
+    table = bytes(ord(alphabet[byte % len(alphabet)]) for byte in range(256))
+    return table, bytes(range(usable, 256))
+
+
+def _random_chars(alphabet: str, k: int) -> str:
+    """Return `k` random characters of the ASCII `alphabet`.
+
+    Random bytes are drawn in blocks from `baker_random`, so the result is
+    reproducible with `baker.seed()`.
+    """
+    table, rejected = _byte_translation(alphabet)
+    chunks = []
+    missing = k
+    while missing > 0:
+        chunk = baker_random.randbytes(missing + 8).translate(table, rejected)
+        chunks.append(chunk)
+        missing -= len(chunk)
+    return b"".join(chunks)[:k].decode("ascii")
 
 
 def get_content_file(content: bytes, name: str) -> ContentFile:
     return ContentFile(content, name=name)
 
 
-def gen_file_field() -> ContentFile:
-    name = "mock_file.txt"
+@cache
+def _mock_file_content(name: str) -> bytes:
+    """Read one of the mock files shipped with baker, once."""
     file_path = abspath(join(dirname(__file__), name))
     with open(file_path, "rb") as f:
-        return get_content_file(f.read(), name=name)
+        return f.read()
+
+
+def gen_file_field() -> ContentFile:
+    name = "mock_file.txt"
+    return get_content_file(_mock_file_content(name), name=name)
 
 
 def gen_image_field() -> ContentFile:
     name = "mock_img.jpeg"
-    file_path = abspath(join(dirname(__file__), name))
-    with open(file_path, "rb") as f:
-        return get_content_file(f.read(), name=name)
+    return get_content_file(_mock_file_content(name), name=name)
 
 
 def gen_from_list(a_list: list[str] | range) -> Callable:
     """Make sure all values of the field are generated from a list.
 
+    Sequences such as lists, tuples and ranges are sampled in place, in
+    constant time; other iterables are turned into a list on every call.
+
     Examples:
         Here how to use it.
 
@@ -61,6 +195,8 @@ def gen_from_list(a_list: list[str] | range) -> Callable:
         >>>     attr_mapping = {'some_field': gen_from_list(['A', 'B', 'C'])}
 
     """
+    if isinstance(a_list, Sequence):
+        return lambda: baker_random.choice(a_list)
     return lambda: baker_random.choice(list(a_list))
 
 
@@ -112,6 +248,31 @@ def _get_field_range(field_name: str) -> tuple[int, int]:
     )
 
 
+def _random_integers(n: int, min_int: int, max_int: int) -> list[int]:
+    randrange = baker_random.randrange
+    return [randrange(min_int, max_int + 1) for _ in range(n)]
+
+
+def _batch_integers(
+    field_name: str,
+    random_integers: Callable[[int, int, int], list[int]] = _random_integers,
+) -> Callable[..., list[int]]:
+    """Build the `batch` protocol of a field-specific integer generator.
+
+    `random_integers(n, min_int, max_int)` draws the values, bounds included.
+    """
+
+    def batch(
+        n: int, min_int: int | None = None, max_int: int | None = None
+    ) -> list[int]:
+        field_min, field_max = _get_field_range(field_name)
+        actual_min = min_int if min_int is not None else field_min
+        actual_max = max_int if max_int is not None else field_max
+        return random_integers(n, actual_min, actual_max)
+
+    return batch
+
+
 def gen_small_integer(min_int: int | None = None, max_int: int | None = None) -> int:
     """Generate integer for SmallIntegerField.
 
@@ -124,6 +285,9 @@ def gen_small_integer(min_int: int | None = None, max_int: int | None = None) ->
     return baker_random.randint(actual_min, actual_max)
 
 
+gen_small_integer.batch = _batch_integers("SmallIntegerField")  # type: ignore[attr-defined]
+
+
 def gen_positive_small_integer(
     min_int: int | None = None, max_int: int | None = None
 ) -> int:
@@ -138,6 +302,9 @@ def gen_positive_small_integer(
     return baker_random.randint(actual_min, actual_max)
 
 
+gen_positive_small_integer.batch = _batch_integers("PositiveSmallIntegerField")  # type: ignore[attr-defined]
+
+
 def gen_positive_integer(min_int: int | None = None, max_int: int | None = None) -> int:
     """Generate integer for PositiveIntegerField.
 
@@ -150,6 +317,9 @@ def gen_positive_integer(min_int: int | None = None, max_int: int | None = None)
     return baker_random.randint(actual_min, actual_max)
 
 
+gen_positive_integer.batch = _batch_integers("PositiveIntegerField")  # type: ignore[attr-defined]
+
+
 def gen_big_integer(min_int: int | None = None, max_int: int | None = None) -> int:
     """Generate integer for BigIntegerField.
 
@@ -162,6 +332,9 @@ def gen_big_integer(min_int: int | None = None, max_int: int | None = None) -> i
     return baker_random.randint(actual_min, actual_max)
 
 
+gen_big_integer.batch = _batch_integers("BigIntegerField")  # type: ignore[attr-defined]
+
+
 def gen_positive_big_integer(
     min_int: int | None = None, max_int: int | None = None
 ) -> int:
@@ -176,6 +349,9 @@ def gen_positive_big_integer(
     return baker_random.randint(actual_min, actual_max)
 
 
+gen_positive_big_integer.batch = _batch_integers("PositiveBigIntegerField")  # type: ignore[attr-defined]
+
+
 def gen_regular_integer(min_int: int | None = None, max_int: int | None = None) -> int:
     """Generate integer for IntegerField.
 
@@ -188,6 +364,9 @@ def gen_regular_integer(min_int: int | None = None, max_int: int | None = None)
     return baker_random.randint(actual_min, actual_max)
 
 
+gen_regular_integer.batch = _batch_integers("IntegerField")  # type: ignore[attr-defined]
+
+
 def gen_auto_field(min_int: int | None = None, max_int: int | None = None) -> int:
     """Generate integer for AutoField.
 
@@ -241,7 +420,7 @@ def gen_float(min_float: float = -1000000.0, max_float: float = 1000000.0) -> fl
 
 def gen_decimal(max_digits: int, decimal_places: int) -> Decimal:
     def num_as_str(x: int) -> str:
-        return "".join([str(baker_random.randint(0, 9)) for _ in range(x)])
+        return _random_chars(string.digits, x)
 
     if decimal_places:
         return Decimal(
@@ -251,7 +430,36 @@ def gen_decimal(max_digits: int, decimal_places: int) -> Decimal:
     return Decimal(num_as_str(max_digits))
 
 
+def _batch_decimals(
+    random_digits: Callable[[int], str],
+) -> Callable[..., list[Decimal]]:
+    """Build the `batch` protocol of `gen_decimal`.
+
+    `random_digits(k)` draws a string of `k` random digits.
+    """
+
+    def batch(n: int, max_digits: int, decimal_places: int) -> list[Decimal]:
+        integer_digits = (
+            max(max_digits - decimal_places - 1, 0) if decimal_places else max_digits
+        )
+        width = integer_digits + decimal_places
+        digits = random_digits(n * width)
+        values = []
+        for start in range(0, n * width, width):
+            number = digits[start : start + width]
+            if decimal_places:
+                number = f"{number[:integer_digits]}.{number[integer_digits:]}"
+            values.append(Decimal(number))
+        return values
+
+    return batch
+
+
+_gen_decimal_batch = _batch_decimals(lambda k: _random_chars(string.digits, k))
+
+
 gen_decimal.required = ["max_digits", "decimal_places"]  # type: ignore[attr-defined]
+gen_decimal.batch = _gen_decimal_batch  # type: ignore[attr-defined]
 
 
 def gen_date() -> date:
@@ -267,7 +475,7 @@ def gen_time() -> time:
 
 
 def gen_string(max_length: int) -> str:
-    return "".join(baker_random.choice(string.ascii_letters) for _ in range(max_length))
+    return _random_chars(string.ascii_letters, max_length)
 
 
 def _gen_string_get_max_length(field: Field) -> tuple[str, int]:
@@ -277,12 +485,20 @@ def _gen_string_get_max_length(field: Field) -> tuple[str, int]:
     return "max_length", max_length
 
 
+def _gen_string_batch(n: int, max_length: int) -> list[str]:
+    if not max_length:
+        return [""] * n
+    text = _random_chars(string.ascii_letters, n * max_length)
+    return [text[i : i + max_length] for i in range(0, n * max_length, max_length)]
+
+
 gen_string.required = [_gen_string_get_max_length]  # type: ignore[attr-defined]
+gen_string.batch = _gen_string_batch  # type: ignore[attr-defined]
 
 
 def gen_slug(max_length: int) -> str:
     valid_chars = string.ascii_letters + string.digits + "_-"
-    return "".join(baker_random.choice(valid_chars) for _ in range(max_length))
+    return _random_chars(valid_chars, max_length)
 
 
 gen_slug.required = ["max_length"]  # type: ignore[attr-defined]
@@ -318,11 +534,21 @@ def gen_email() -> str:
 
 
 def gen_ipv6() -> str:
-    return ":".join(format(baker_random.randint(1, 65535), "x") for _ in range(8))
+    groups = list(struct.unpack(">8H", baker_random.randbytes(16)))
+    for i, group in enumerate(groups):
+        while not group:
+            group = baker_random.getrandbits(16)
+        groups[i] = group
+    return ":".join(format(group, "x") for group in groups)
 
 
 def gen_ipv4() -> str:
-    return ".".join(str(baker_random.randint(1, 255)) for _ in range(4))
+    octets = list(baker_random.randbytes(4))
+    for i, octet in enumerate(octets):
+        while not octet:
+            octet = baker_random.getrandbits(8)
+        octets[i] = octet
+    return ".".join(map(str, octets))
 
 
 def gen_ipv46() -> str:
@@ -363,8 +589,7 @@ gen_ip.required = ["protocol", "default_validators"]  # type: ignore[attr-define
 
 
 def gen_byte_string(max_length: int = 16) -> bytes:
-    generator = (baker_random.randint(0, 255) for x in range(max_length))
-    return bytes(generator)
+    return baker_random.randbytes(max_length)
 
 
 def gen_interval(
@@ -382,12 +607,14 @@ def gen_interval(
     return timedelta(**kwargs)
 
 
-def gen_content_type():
+def gen_content_type(_using: str = ""):
     from django.apps import apps
     from django.contrib.contenttypes.models import ContentType
 
+    from .content_types import get_content_type
+
     try:
-        return ContentType.objects.get_for_model(baker_random.choice(apps.get_models()))
+        return get_content_type(baker_random.choice(apps.get_models()), using=_using)
     except (AssertionError, RuntimeError):
         # AssertionError is raised by Django's test framework when db access is not available:
         # https://github.com/django/django/blob/stable/4.0.x/django/test/testcases.py#L150
@@ -399,12 +626,23 @@ def gen_content_type():
         return ContentType()
 
 
+gen_content_type.required = ["_using"]  # type: ignore[attr-defined]
+
+
 def gen_uuid() -> UUID:
     import uuid
 
     return uuid.uuid4()
 
 
+def _gen_uuid_batch(n: int) -> list[UUID]:
+    data = os.urandom(16 * n)
+    return [UUID(bytes=data[i : i + 16], version=4) for i in range(0, 16 * n, 16)]
+
+
+gen_uuid.batch = _gen_uuid_batch  # type: ignore[attr-defined]
+
+
 def gen_array():
     return []
 
@@ -1,6 +1,12 @@
 import collections
 import copy
+import datetime
+import decimal
 import itertools
+import sys
+import uuid
+import weakref
+from collections.abc import Callable
 from typing import (
     Any,
     Generic,
@@ -8,16 +14,131 @@ from typing import (
     overload,
 )
 
+from django.db import connections, router
+from django.db.models import AutoField, Model
+from django.db.models.base import ModelState
+from django.db.models.signals import post_init, post_migrate
+
 from . import baker
 from ._types import M
-from .exceptions import RecipeNotFound
+from .exceptions import InvalidQuantityException, RecipeNotFound
 from .utils import (
+    SeqIterator,
     get_calling_module,
     seq,  # noqa: F401 - Enable seq to be imported from recipes
 )
 
 finder = baker.ModelFinder()
 
+# all recipes, to restart their iterators with `baker.reset_sequences()`
+_all_recipes: "weakref.WeakSet[Recipe]" = weakref.WeakSet()
+
+
+def _reset_sequences(**kwargs: Any) -> None:
+    for recipe in list(_all_recipes):
+        recipe._reset_iterators()
+
+
+# the database is flushed or migrated, e.g. between transactional tests
+post_migrate.connect(_reset_sequences)
+
+
+def _defining_module() -> str | None:
+    """Return the name of the module creating a recipe.
+
+    Frames of recipes creating other recipes, such as `__init__` of a subclass
+    or `extend`, are skipped.
+    """
+    frame = sys._getframe(1)
+    while frame is not None and isinstance(frame.f_locals.get("self"), Recipe):
+        frame = frame.f_back
+    return None if frame is None else frame.f_globals.get("__name__")
+
+
+class _IteratorState:
+    """Where a recipe is in one of its iterators, which can be restarted.
+
+    `seq` iterators are restarted from a new `SeqIterator`, so no value is kept.
+    Other iterators can only be replayed from the values they produced, which
+    are kept by `itertools.tee`.
+    """
+
+    def __init__(self, iterator: collections.abc.Iterator) -> None:
+        self._source = iterator
+        self.restart()
+
+    def restart(self) -> None:
+        if isinstance(self._source, SeqIterator):
+            self.iterator = self._source.restart()
+        else:
+            self._source, self.iterator = itertools.tee(self._source)
+
+
+# values which are shared by all the objects made from a recipe
+_IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+    range,
+)
+
+# how each attr of a recipe is resolved for every object made from it
+_VALUE = "value"
+_ITERATOR = "iterator"
+_FOREIGN_KEY = "foreign_key"
+_RELATED = "related"
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in value)
+    return isinstance(value, _IMMUTABLE_TYPES)
+
+
+def _copier(value: Any) -> Callable[[Any], Any] | None:
+    """Return how to copy a container attr for every object, if it's mutable."""
+    if _is_immutable(value):
+        return None
+    if type(value) is dict:
+        items = itertools.chain.from_iterable(value.items())
+    elif type(value) in (list, set):
+        items = value
+    else:
+        return copy.deepcopy
+    # a flat container only needs to be copied, not its items
+    return copy.copy if all(_is_immutable(item) for item in items) else copy.deepcopy
+
+
+def _compile_attr(value: Any) -> tuple[str | Callable[[Any], Any], Any]:
+    if isinstance(value, collections.abc.Iterator):
+        return _ITERATOR, value
+    elif isinstance(value, RecipeForeignKey):
+        return _FOREIGN_KEY, value
+    elif isinstance(value, related):
+        return _RELATED, value
+    elif isinstance(value, collections.abc.Container):
+        return _copier(value) or _VALUE, value
+    return _VALUE, value
+
+
+def _clone(template: M) -> M:
+    """Return a copy of the unsaved `template`, without calling `__init__`."""
+    clone = template.__class__.__new__(template.__class__)
+    clone.__dict__ = template.__dict__.copy()
+    clone._state = ModelState()
+    clone._state.db = template._state.db
+    clone._state.fields_cache = template._state.fields_cache.copy()
+    return clone
+
 
 class Recipe(Generic[M]):
     _T = TypeVar("_T", bound="Recipe")
@@ -25,32 +146,138 @@ class Recipe(Generic[M]):
     def __init__(self, _model: str | type[M], **attrs: Any) -> None:
         self.attr_mapping = attrs
         self._model = _model
-        # _iterator_backups will hold values of the form (backup_iterator, usable_iterator).
-        self._iterator_backups = {}  # type: dict[str, Any]
+        # where the recipe is in each of its iterators, by iterator id; shared
+        # with the recipes extending it, so they take values from the same ones
+        self._iterators = {}  # type: dict[int, _IteratorState]
+        # the attrs by name, with how to resolve them, compiled on first use
+        self._slots = None  # type: dict[str, tuple[Any, Any]] | None
+        # prepared instances to clone by database alias, when all the values
+        # of the model are given by the recipe
+        self._templates = {}  # type: dict[str, M]
+        self._clonable = None  # type: bool | None
+        # database alias and innermost atomic block of the last `make` which
+        # took values from the iterators
+        self._last_transaction = None  # type: tuple[str, Any] | None
+        # name of the module defining the recipe, e.g. an app's `baker_recipes`
+        self._module = _defining_module()
+        _all_recipes.add(self)
+
+    def _compiled(self) -> dict[str, tuple[Any, Any]]:
+        if self._slots is None:
+            self._slots = {k: _compile_attr(v) for k, v in self.attr_mapping.items()}
+        return self._slots
+
+    def _can_clone(self) -> bool:
+        """Return whether every object prepared from this recipe is the same.
+
+        That is when the recipe gives a shared value to every concrete field,
+        so baker generates nothing, and when the model has no `__init__` of its
+        own.
+        """
+        if self._clonable is None:
+            model = self._model
+            if isinstance(model, str):
+                model = finder.get_model(model)
+            slots = self._compiled()
+            self._clonable = (
+                all(
+                    kind is _VALUE and not callable(v) and "__" not in k
+                    for k, (kind, v) in slots.items()
+                )
+                and all(
+                    field.name in slots
+                    or field.attname in slots
+                    or field.auto_created
+                    or isinstance(field, AutoField)
+                    for field in model._meta.concrete_fields
+                )
+                and model.__init__ is Model.__init__
+            )
+        return self._clonable
+
+    def _can_bulk_create(self, _using: str) -> bool:
+        """Return whether the objects of this recipe can be bulk created.
+
+        Otherwise they are saved one by one, as `bulk_create()` can't insert
+        multi-table inherited models or models ordered with respect to another.
+        """
+        model = self._model
+        if isinstance(model, str):
+            model = finder.get_model(model)
+        return baker._can_bulk_insert(model, _using or router.db_for_write(model))
+
+    def _shares_foreign_keys(self, attrs: dict[str, Any]) -> bool:
+        """Return whether objects made together would share a foreign key.
+
+        That is when the recipe has a `foreign_key` without `one_to_one=True`
+        which isn't overridden by `attrs`.
+        """
+        return any(
+            kind is _FOREIGN_KEY and not v.one_to_one and k not in attrs
+            for k, (kind, v) in self._compiled().items()
+        )
+
+    def _reset_iterators(self) -> None:
+        """Restart the iterators of this recipe from their first value."""
+        for state in self._iterators.values():
+            state.restart()
+
+    def _restart_rolled_back_iterators(
+        self, _using: str, iterators: list[collections.abc.Iterator]
+    ) -> None:
+        """Restart `iterators` if no object of the model is left.
+
+        Objects are only gone once the transaction block they were made in has
+        ended, e.g. when a `TestCase` test is rolled back, so the database is
+        only queried then.
+        """
+        model = self._model
+        if isinstance(model, str):
+            model = finder.get_model(model)
+        using = _using or router.db_for_write(model)
+        atomic_blocks = connections[using].atomic_blocks
+        last_transaction = self._last_transaction
+        self._last_transaction = (using, atomic_blocks[-1] if atomic_blocks else None)
+        if last_transaction is None:
+            return
+        last_using, last_block = last_transaction
+        if last_using == using and (last_block is None or last_block in atomic_blocks):
+            return
+        if not model._default_manager.db_manager(using).exists():
+            for iterator in iterators:
+                state = self._iterators.get(id(iterator))
+                if state is not None:
+                    state.restart()
 
     def _mapping(  # noqa: C901
-        self, _using: str, new_attrs: dict[str, Any]
+        self, _using: str, new_attrs: dict[str, Any], commit: bool = False
     ) -> dict[str, Any]:
         _save_related = new_attrs.get("_save_related", True)
         _quantity = new_attrs.get("_quantity", 1)
+        _bulk_create = new_attrs.get("_bulk_create", False)
         rel_fields_attrs = {k: v for k, v in new_attrs.items() if "__" in k}
         new_attrs = {k: v for k, v in new_attrs.items() if "__" not in k}
-        mapping = self.attr_mapping.copy()
-        for k, v in self.attr_mapping.items():
+        if commit:
+            iterators = [
+                v
+                for k, (kind, v) in self._compiled().items()
+                if kind is _ITERATOR and k not in new_attrs
+            ]
+            if iterators:
+                self._restart_rolled_back_iterators(_using, iterators)
+        mapping = {}
+        for k, (kind, v) in self._compiled().items():
             # do not generate values if field value is provided
             if k in new_attrs:
                 continue
-            elif isinstance(v, collections.abc.Iterator):
-                if isinstance(self._model, str):
-                    m = finder.get_model(self._model)
-                else:
-                    m = self._model
-                if k not in self._iterator_backups or not m.objects.exists():
-                    self._iterator_backups[k] = itertools.tee(
-                        self._iterator_backups.get(k, [v])[0]
-                    )
-                mapping[k] = self._iterator_backups[k][1]
-            elif isinstance(v, RecipeForeignKey):
+            elif kind is _VALUE:
+                mapping[k] = v
+            elif kind is _ITERATOR:
+                state = self._iterators.get(id(v))
+                if state is None:
+                    state = self._iterators[id(v)] = _IteratorState(v)
+                mapping[k] = state.iterator
+            elif kind is _FOREIGN_KEY:
                 attrs = {}
                 # Remove any related field attrs from the recipe attrs before filtering
                 for key, _value in list(rel_fields_attrs.items()):
@@ -60,20 +287,35 @@ class Recipe(Generic[M]):
                 if _save_related:
                     # Create a unique foreign key for each quantity if one_to_one required
                     if v.one_to_one is True:
-                        rel_gen = [
-                            v.recipe.make(_using=_using, **recipe_attrs)
-                            for _ in range(_quantity)
-                        ]
+                        if v.recipe._shares_foreign_keys(recipe_attrs):
+                            # each related object gets its own foreign keys
+                            rel_gen = [
+                                v.recipe.make(_using=_using, **recipe_attrs)
+                                for _ in range(_quantity)
+                            ]
+                        else:
+                            rel_gen = v.recipe.make(
+                                _quantity=_quantity,
+                                _using=_using,
+                                _bulk_create=_bulk_create
+                                and v.recipe._can_bulk_create(_using),
+                                **recipe_attrs,
+                            )
                         mapping[k] = itertools.cycle(rel_gen)
                     # Otherwise create shared foreign key for each quantity
                     else:
-                        mapping[k] = v.recipe.make(_using=_using, **recipe_attrs)
+                        mapping[k] = v.recipe.make(
+                            _using=_using,
+                            _bulk_create=_bulk_create
+                            and v.recipe._can_bulk_create(_using),
+                            **recipe_attrs,
+                        )
                 else:
                     mapping[k] = v.recipe.prepare(_using=_using, **recipe_attrs)
-            elif isinstance(v, related):
+            elif kind is _RELATED:
                 mapping[k] = v.make
-            elif isinstance(v, collections.abc.Container):
-                mapping[k] = copy.deepcopy(v)
+            else:
+                mapping[k] = kind(v)
 
         mapping.update(new_attrs)
         mapping.update(rel_fields_attrs)
@@ -131,7 +373,9 @@ class Recipe(Generic[M]):
             defaults["_save_kwargs"] = _save_kwargs  # type: ignore[assignment]
 
         defaults.update(attrs)
-        return baker.make(self._model, _using=_using, **self._mapping(_using, defaults))
+        return baker.make(
+            self._model, _using=_using, **self._mapping(_using, defaults, commit=True)
+        )
 
     @overload
     def prepare(
@@ -164,6 +408,26 @@ class Recipe(Generic[M]):
         if _quantity is not None:
             defaults["_quantity"] = _quantity  # type: ignore[assignment]
 
+        if (
+            not attrs
+            and not _save_related
+            and self._can_clone()
+            and baker._custom_baker_class() is None
+        ):
+            if baker._valid_quantity(_quantity):
+                raise InvalidQuantityException
+            # prepare the instance once, then copy it
+            if _using not in self._templates:
+                self._templates[_using] = baker.prepare(
+                    self._model, _using=_using, **self._mapping(_using, {})
+                )
+            template = self._templates[_using]
+            # `post_init` receivers expect to run for every instance
+            if not post_init.has_listeners(type(template)):
+                if _quantity is None:
+                    return _clone(template)
+                return [_clone(template) for _ in range(_quantity)]
+
         defaults.update(attrs)
         return baker.prepare(
             self._model, _using=_using, **self._mapping(_using, defaults)
@@ -172,7 +436,12 @@ class Recipe(Generic[M]):
     def extend(self: _T, **attrs: Any) -> _T:
         attr_mapping = self.attr_mapping.copy()
         attr_mapping.update(attrs)
-        return type(self)(self._model, **attr_mapping)
+        recipe = type(self)(self._model, **attr_mapping)
+        # only the new attrs need to be compiled
+        recipe._slots = self._compiled().copy()
+        recipe._slots.update((k, _compile_attr(v)) for k, v in attrs.items())
+        recipe._iterators = self._iterators
+        return recipe
 
 
 def _load_recipe_from_calling_module(recipe_name: str) -> Recipe[Any]:
@@ -247,3 +516,24 @@ class related(Generic[M]):  # FIXME
     def make(self, **attrs: Any) -> list[M | list[M]]:
         """Persist objects to m2m relation."""
         return [m.make(**attrs) for m in self.related]
+
+    def bulk_make(
+        self, field_name: str, instances: list[Any], _using: str = ""
+    ) -> list[list[M]]:
+        """Make the objects of every recipe for each of `instances`.
+
+        Each recipe is made once, with `field_name` pointing at `instances`,
+        and bulk created when Django can.
+        """
+        made = []
+        for m in self.related:
+            attrs: dict[str, Any] = {field_name: iter(instances)}
+            made.append(
+                m.make(
+                    _quantity=len(instances),
+                    _using=_using,
+                    _bulk_create=m._can_bulk_create(_using),
+                    **attrs,
+                )
+            )
+        return made
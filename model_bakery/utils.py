@@ -3,8 +3,9 @@ import decimal
 import importlib
 import inspect
 import itertools
+import sys
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from types import ModuleType
 from typing import Any
 
@@ -12,7 +13,7 @@ from django.apps import apps
 
 from .timezone import tz_aware
 
-__all__ = ["import_from_str", "get_calling_module", "seq"]
+__all__ = ["import_from_str", "get_calling_module", "seq", "SeqIterator"]
 
 
 def import_from_str(import_string: Callable | str | None) -> Any:
@@ -47,7 +48,14 @@ def get_calling_module(levels_back: int) -> ModuleType | None:
     Returns:
         (ModuleType): the module from which the code was called
     """
-    frame = inspect.stack()[levels_back + 1][0]
+    try:
+        # only the requested frame is looked up, unlike with `inspect.stack()`
+        frame = sys._getframe(levels_back + 1)
+    except ValueError:
+        raise IndexError("call stack is not deep enough") from None
+    module = sys.modules.get(frame.f_globals.get("__name__", ""))
+    if module is not None and module.__dict__ is frame.f_globals:
+        return module
     return inspect.getmodule(frame)
 
 
@@ -84,12 +92,39 @@ def _seq_datetime(
             yield series_date
 
 
+class SeqIterator(Iterator):
+    """The iterator of values returned by `seq`.
+
+    A sequence can be restarted from its first value without keeping the
+    values it produced, as they are generated again from its parameters.
+    """
+
+    def __init__(self, *params: Any, _origin: "SeqIterator | None" = None) -> None:
+        self._params = params
+        self._origin = _origin or self
+        self._validated = False
+        self._values: Iterator | None = None
+
+    def __next__(self) -> Any:
+        if self._values is None:
+            # parameters are validated once, even if the sequence is restarted
+            if not self._origin._validated:
+                _validate_sequence_parameters(*self._params)
+                self._origin._validated = True
+            self._values = _seq(*self._params)
+        return next(self._values)
+
+    def restart(self) -> "SeqIterator":
+        """Return a new sequence of the same values, from the first one."""
+        return type(self)(*self._params, _origin=self._origin)
+
+
 def seq(
     value,
     increment_by: int | float | decimal.Decimal | datetime.timedelta = 1,
     start: int | float | None = None,
     suffix=None,
-):
+) -> SeqIterator:
     """Generate a sequence of values based on a running count.
 
     This function can be used to generate sequences of `int`, `float`,
@@ -109,10 +144,12 @@ def seq(
             value is appended)
 
     Returns:
-        object: generated values for sequential data
+        SeqIterator: generated values for sequential data
     """
-    _validate_sequence_parameters(value, increment_by, start, suffix)
+    return SeqIterator(value, increment_by, start, suffix)
+
 
+def _seq(value, increment_by, start, suffix):
     if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
         yield from _seq_datetime(value, increment_by)
     else:
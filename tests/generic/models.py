@@ -61,6 +61,14 @@ OCCUPATION_CHOICES = (
     ("Education", (("teacher", "Teacher"), ("principal", "Principal"))),
 )
 
+# returned by `get_flavor_choices`, which tests may change
+FLAVOR_CHOICES = [("vanilla", "Vanilla"), ("chocolate", "Chocolate")]
+
+
+def get_flavor_choices():
+    return FLAVOR_CHOICES
+
+
 TEST_TIME = datetime.datetime(2014, 7, 21, 15, 39, 58, 457698)
 
 
@@ -200,6 +208,10 @@ class Cake(models.Model):
     name = models.CharField(max_length=64)
 
 
+class IceCream(models.Model):
+    flavor = models.CharField(max_length=16, choices=get_flavor_choices)
+
+
 class RelatedNamesModel(models.Model):
     name = models.CharField(max_length=256)
     one_to_one = models.OneToOneField(
@@ -1,13 +1,16 @@
+import asyncio
 import datetime
 import itertools
+import random
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from unittest.mock import patch
 
 from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db.models import Manager, ManyToOneRel
-from django.db.models.signals import m2m_changed
+from django.db.models import CharField, Manager, ManyToOneRel
+from django.db.models.signals import m2m_changed, post_save
 from django.test import TestCase
 
 import pytest
@@ -21,6 +24,7 @@ from model_bakery.exceptions import (
 )
 from model_bakery.timezone import tz_aware
 from tests.generic import baker_recipes, models
+from tests.generic.fields import CustomFieldViaSettings
 from tests.generic.forms import DummyGenericIPAddressFieldForm
 
 
@@ -87,6 +91,56 @@ class TestRecipeFinder:
         with pytest.raises(ValueError):
             baker.prepare_recipe("person")
 
+    def test_recipe_is_resolved_once(self):
+        baker.prepare_recipe("generic.person")
+        with patch("model_bakery.baker.import_from_str") as import_from_str:
+            obj = baker.prepare_recipe("generic.person")
+        import_from_str.assert_not_called()
+        assert obj.name == "John Doe"
+
+    def test_autodiscover_recipes(self):
+        baker.autodiscover_recipes()
+        baker.reset_sequences()
+        with patch("model_bakery.baker.import_from_str") as import_from_str:
+            obj = baker.prepare_recipe("generic.serial_person")
+            full_path_obj = baker.prepare_recipe("tests.generic.serial_person")
+        import_from_str.assert_not_called()
+        assert obj.name == "joe1"
+        assert full_path_obj.name == "joe2"
+
+    def test_get_recipes_for_model(self):
+        from tests.generic import baker_recipes
+
+        baker.autodiscover_recipes()
+        recipes = baker.get_recipes_for_model(models.Person)
+        assert recipes["generic.person"] is baker_recipes.person
+        assert recipes["generic.serial_person"] is baker_recipes.serial_person
+        assert "generic.dog" not in recipes
+        assert baker.get_recipes_for_model("generic.Person") == recipes
+        assert baker.get_recipes_for_model(models.Dog)["generic.dog"] is (
+            baker_recipes.dog
+        )
+
+    def test_autodiscover_recipes_skips_imported_recipes(self, monkeypatch):
+        from model_bakery.recipe import Recipe
+        from tests.generic import baker_recipes
+
+        imported_person = Recipe(models.Person)
+        monkeypatch.setattr(
+            baker_recipes, "imported_person", imported_person, raising=False
+        )
+        baker.autodiscover_recipes()
+        assert baker_recipes.pug._module == "tests.generic.baker_recipes"
+        assert imported_person._module == __name__
+        recipes = baker.get_recipes_for_model(models.Person)
+        assert "generic.imported_person" not in recipes
+        assert "generic.person" in recipes
+
+    def test_resolved_recipes_are_cleared_with_installed_apps(self, settings):
+        baker.prepare_recipe("generic.person")
+        settings.INSTALLED_APPS = [*settings.INSTALLED_APPS]
+        assert "generic.person" not in baker._recipes
+
 
 class TestsBakerCreatesSimpleModel:
     @pytest.mark.django_db
@@ -397,6 +451,51 @@ class TestBakerCreatesAssociatedModels(TestCase):
         assert home.dogs.count() == 2
         assert models.Dog.objects.count() == 2  # dogs in dogs_set were created
 
+    @pytest.mark.django_db
+    def test_one_to_many_children_are_saved_one_by_one(self):
+        homes = baker.prepare(models.Home, _quantity=3, _save_related=True)
+        saved = []
+
+        def receiver(instance, **kwargs):
+            saved.append(instance)
+
+        post_save.connect(receiver, sender=models.Home)
+        try:
+            person = baker.make(models.Person, home_set=homes)
+        finally:
+            post_save.disconnect(receiver, sender=models.Home)
+
+        assert saved == homes
+        assert set(person.home_set.all()) == set(homes)
+
+    @pytest.mark.django_db
+    def test_unsaved_one_to_many_children_are_inserted_at_once_in_bulk(self):
+        homes = baker.prepare(models.Home, _quantity=5, _save_related=True)
+
+        with self.assertNumQueries(2):
+            person = baker.make(models.Person, home_set=homes, _bulk_create=True)
+
+        assert set(person.home_set.all()) == set(homes)
+        assert all(home.owner == person for home in homes)
+
+    @pytest.mark.django_db
+    def test_saved_one_to_many_children_are_moved_at_once_in_bulk(self):
+        homes = baker.make(models.Home, _quantity=5)
+
+        with self.assertNumQueries(2):
+            person = baker.make(models.Person, home_set=homes, _bulk_create=True)
+
+        assert set(person.home_set.all()) == set(homes)
+        assert models.Person.objects.filter(home__isnull=True).count() == 5
+
+    @pytest.mark.django_db
+    def test_one_to_many_children_with_order_are_saved_one_by_one_in_bulk(self):
+        dogs = baker.prepare(models.Dog, _quantity=2, _save_related=True)
+
+        person = baker.make(models.Person, dog_set=dogs, _bulk_create=True)
+
+        assert list(person.get_dog_order()) == [dog.pk for dog in dogs]
+
     @pytest.mark.django_db
     def test_prepare_fk(self):
         dog = baker.prepare(models.Dog)
@@ -422,7 +521,7 @@ class TestBakerCreatesAssociatedModels(TestCase):
 
     @pytest.mark.django_db
     def test_bulk_create_multiple_one_to_one(self):
-        query_count = 6
+        query_count = 2
         with self.assertNumQueries(query_count):
             baker.make(models.LonelyPerson, _quantity=5, _bulk_create=True)
 
@@ -448,13 +547,44 @@ class TestBakerCreatesAssociatedModels(TestCase):
 
     @pytest.mark.django_db
     def test_bulk_create_multiple_fk(self):
-        query_count = 6
+        query_count = 2
         with self.assertNumQueries(query_count):
             baker.make(models.PaymentBill, _quantity=5, _bulk_create=True)
 
         assert models.PaymentBill.objects.all().count() == 5
         assert models.User.objects.all().count() == 5
 
+    @pytest.mark.django_db
+    def test_bulk_create_nested_fks_level_by_level(self):
+        with self.assertNumQueries(3):
+            bills = baker.make(
+                models.PaymentBill,
+                user__profile__email="valid@example.com",
+                _quantity=5,
+                _bulk_create=True,
+            )
+
+        assert models.Profile.objects.count() == 5
+        for bill in models.PaymentBill.objects.select_related("user__profile"):
+            assert bill.user.profile.email == "valid@example.com"
+        assert {bill.user.profile_id for bill in bills} == set(
+            models.Profile.objects.values_list("pk", flat=True)
+        )
+
+    @pytest.mark.django_db
+    def test_bulk_create_saves_shared_unsaved_fk_once(self):
+        user = baker.prepare(models.User)
+        with self.assertNumQueries(2):
+            baker.make(models.PaymentBill, user=user, _quantity=3, _bulk_create=True)
+
+        assert models.User.objects.count() == 1
+        assert models.PaymentBill.objects.filter(user=user).count() == 3
+
+    def test_multi_table_inherited_models_are_not_bulk_inserted(self):
+        assert baker._can_bulk_insert(models.Person, "default")
+        assert baker._can_bulk_insert(models.ProxyToPersonModel, "default")
+        assert not baker._can_bulk_insert(models.GuardDog, "default")
+
     @pytest.mark.django_db
     def test_create_many_to_many_if_flagged(self):
         store = baker.make(models.Store, make_m2m=True)
@@ -556,6 +686,37 @@ class TestBakerCreatesAssociatedModels(TestCase):
         assert models.SchoolEnrollment.objects.count() == baker.MAX_MANY_QUANTITY
         assert models.Person.objects.count() == baker.MAX_MANY_QUANTITY
 
+    @pytest.mark.django_db
+    def test_create_many_to_many_with_through_saves_rows(self):
+        students = baker.prepare(models.Person, _quantity=3)
+        saved = []
+
+        def receiver(instance, **kwargs):
+            saved.append(instance)
+
+        post_save.connect(receiver, sender=models.SchoolEnrollment)
+        try:
+            school = baker.make(models.School, students=students)
+        finally:
+            post_save.disconnect(receiver, sender=models.SchoolEnrollment)
+
+        assert len(saved) == 3
+        assert set(school.students.all()) == set(students)
+
+    @pytest.mark.django_db
+    def test_create_many_to_many_with_through_in_bulk(self):
+        students = baker.prepare(models.Person, _quantity=5)
+
+        # the school, its students and their enrollments
+        with self.assertNumQueries(3):
+            school = baker.make(models.School, students=students, _bulk_create=True)
+
+        assert all(student.pk for student in students)
+        assert set(school.students.all()) == set(students)
+        enrollments = models.SchoolEnrollment.objects.filter(school=school)
+        assert enrollments.count() == 5
+        assert all(enrollment.start_date for enrollment in enrollments)
+
     @pytest.mark.django_db
     def test_does_not_create_many_to_many_as_default(self):
         store = baker.make(models.Store)
@@ -1162,6 +1323,21 @@ class TestBakerSupportsMultiDatabase(TestCase):
         assert models.Profile.objects.using(settings.EXTRA_DB).count() == 1
         assert models.Profile.objects.using("default").count() == 0
 
+    def test_bulk_create_with_using_keeps_m2m_rows_on_same_db(self):
+        person = baker.make(models.Person, _using=settings.EXTRA_DB)
+
+        baker.make(
+            models.Classroom,
+            students=[person],
+            _quantity=3,
+            _bulk_create=True,
+            _using=settings.EXTRA_DB,
+        )
+
+        through = models.Classroom.students.through
+        assert through.objects.using(settings.EXTRA_DB).count() == 3
+        assert through.objects.using("default").count() == 0
+
     def test_allow_recipe_to_specify_database_via_using(self):
         dog = baker.make_recipe("generic.homeless_dog", _using=settings.EXTRA_DB)
         qs = models.Dog.objects.using(settings.EXTRA_DB).all()
@@ -1254,6 +1430,19 @@ class TestBakerAutomaticallyRefreshFromDB:
 
         assert person.birthday == datetime.date(2017, 2, 1)
 
+    @pytest.mark.django_db
+    def test_refresh_quantity_with_one_query(self, django_assert_num_queries):
+        # one insert per instance and a single select
+        with django_assert_num_queries(6):
+            people = baker.make(
+                models.Person,
+                birthday="2017-02-01",
+                _quantity=5,
+                _refresh_after_create=True,
+            )
+
+        assert all(person.birthday == datetime.date(2017, 2, 1) for person in people)
+
     @pytest.mark.django_db
     def test_do_not_refresh_from_db_if_false(self):
         person = baker.make(
@@ -1294,6 +1483,23 @@ class TestBakerMakeCanFetchInstanceFromDefaultManager:
         )
         assert movie.title == movie.name
 
+    @pytest.mark.django_db
+    def test_fetch_quantity_from_manager_with_one_query(
+        self, django_assert_num_queries
+    ):
+        titles = ["Old Boy", "Oldeuboi", "Lady Vengeance"]
+
+        # two inserts per multi-table inherited instance and a single select
+        with django_assert_num_queries(7):
+            movies = baker.make(
+                models.MovieWithAnnotation,
+                title=iter(titles),
+                _from_manager="objects",
+                _quantity=3,
+            )
+
+        assert [movie.name for movie in movies] == titles
+
 
 class TestCreateM2MWhenBulkCreate(TestCase):
     """Tests for M2M field population when using _bulk_create=True."""
@@ -1302,7 +1508,7 @@ class TestCreateM2MWhenBulkCreate(TestCase):
     def test_create(self):
         person = baker.make(models.Person)
 
-        with self.assertNumQueries(11):
+        with self.assertNumQueries(2):
             baker.make(
                 models.Classroom, students=[person], _quantity=10, _bulk_create=True
             )
@@ -1313,7 +1519,7 @@ class TestCreateM2MWhenBulkCreate(TestCase):
     def test_make_should_create_objects_using_reverse_name(self):
         classroom = baker.make(models.Classroom)
 
-        with self.assertNumQueries(21):
+        with self.assertNumQueries(2):
             baker.make(
                 models.Person,
                 classroom_set=[classroom],
@@ -1336,7 +1542,7 @@ class TestCreateM2MWhenBulkCreate(TestCase):
         """
         person = baker.make(models.Person)
 
-        with self.assertNumQueries(11):
+        with self.assertNumQueries(2):
             baker.make(
                 models.Store, customers=[person], _quantity=10, _bulk_create=True
             )
@@ -1359,6 +1565,48 @@ class TestCreateM2MWhenBulkCreate(TestCase):
         for owner in models.HomeOwner.objects.all():
             assert list(owner.home.dogs.all()) == [dog]
 
+    @pytest.mark.django_db
+    def test_through_rows_of_all_entries_are_inserted_at_once(self):
+        students = baker.make(models.Person, _quantity=3)
+
+        with self.assertNumQueries(2):
+            classrooms = baker.make(
+                models.Classroom, students=students, _quantity=10, _bulk_create=True
+            )
+
+        through = models.Classroom.students.through
+        assert through.objects.count() == 30
+        for classroom in classrooms:
+            assert set(classroom.students.all()) == set(students)
+
+    @pytest.mark.django_db
+    def test_reverse_name_relates_repeated_objects_once(self):
+        classroom = baker.make(models.Classroom)
+
+        baker.make(
+            models.Person,
+            classroom_set=[classroom, classroom],
+            _quantity=2,
+            _bulk_create=True,
+        )
+
+        assert models.Classroom.students.through.objects.count() == 2
+
+    @pytest.mark.django_db
+    def test_reverse_name_saves_unsaved_objects(self):
+        classrooms = baker.prepare(models.Classroom, _quantity=2)
+
+        baker.make(
+            models.Person,
+            classroom_set=classrooms,
+            _quantity=2,
+            _bulk_create=True,
+        )
+
+        assert all(classroom.pk for classroom in classrooms)
+        for person in models.Person.objects.all():
+            assert set(person.classroom_set.all()) == set(classrooms)
+
 
 class TestBakerSeeded:
     @pytest.fixture
@@ -1366,6 +1614,7 @@ class TestBakerSeeded:
         old_state = random_gen.baker_random.getstate()
         yield
         random_gen.baker_random.setstate(old_state)
+        random_gen._root_seed = None
         baker.Baker._global_seed = baker.Baker.SENTINEL
 
     @pytest.mark.django_db
@@ -1378,6 +1627,58 @@ class TestBakerSeeded:
     def test_unseeded(self):
         assert baker.Baker._global_seed is baker.Baker.SENTINEL
 
+    @staticmethod
+    def _strings_in_stream(key):
+        with baker.random_stream(key):
+            return [random_gen.gen_string(10) for _ in range(50)]
+
+    def test_random_streams_in_threads(self, reset_seed):
+        baker.seed(1)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = list(executor.map(self._strings_in_stream, range(8)))
+        baker.seed(1)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            second = list(executor.map(self._strings_in_stream, reversed(range(8))))
+
+        assert first == second[::-1]
+        assert first[0] != first[1]
+
+    def test_random_streams_in_tasks(self, reset_seed):
+        async def strings_in_stream(key):
+            with baker.random_stream(key):
+                strings = []
+                for _ in range(5):
+                    strings.append(random_gen.gen_string(10))
+                    await asyncio.sleep(0)
+                return strings
+
+        async def main():
+            return await asyncio.gather(*(strings_in_stream(key) for key in "abc"))
+
+        baker.seed(1)
+        interleaved = asyncio.run(main())
+        baker.seed(1)
+        assert interleaved == [self._strings_in_stream(key)[:5] for key in "abc"]
+
+    def test_seed_in_random_stream(self, reset_seed):
+        baker.seed(1)
+        root_state = random_gen.baker_random.getstate()
+        with baker.random_stream("a"):
+            baker.seed(2)
+            value = random_gen.gen_string(10)
+            baker.seed(2)
+            assert random_gen.gen_string(10) == value
+        assert random_gen.baker_random.getstate() == root_state
+
+    def test_baker_random_is_a_random(self, reset_seed):
+        assert isinstance(random_gen.baker_random, random.Random)
+        baker.seed(1)
+        with baker.random_stream("a") as stream:
+            state = stream.getstate()
+            value = random_gen.baker_random.randint(0, 1000)
+            stream.setstate(state)
+            assert stream.randint(0, 1000) == value
+
 
 class TestAutoNowFields:
     @pytest.mark.django_db
@@ -1423,6 +1724,65 @@ class TestAutoNowFields:
         assert instance.updated == updated
         assert instance.sent_date == sent_date
 
+    @pytest.mark.django_db
+    def test_make_quantity_with_auto_now_updates_once(
+        self, settings, django_assert_num_queries
+    ):
+        tzinfo = datetime.timezone.utc if settings.USE_TZ else None
+        now = datetime.datetime(2023, 10, 20, 15, 30, tzinfo=tzinfo)
+
+        # one insert per instance and a single update
+        with django_assert_num_queries(6):
+            instances = baker.make(
+                models.ModelWithAutoNowFields, created=now, updated=now, _quantity=5
+            )
+
+        for instance in instances:
+            assert instance.created == instance.updated == now
+        assert set(
+            models.ModelWithAutoNowFields.objects.values_list("created", "updated")
+        ) == {(now, now)}
+
+    @pytest.mark.django_db
+    def test_make_quantity_with_distinct_auto_now_values(
+        self, settings, django_assert_num_queries
+    ):
+        tzinfo = datetime.timezone.utc if settings.USE_TZ else None
+        dates = [datetime.datetime(2023, 10, day, tzinfo=tzinfo) for day in range(1, 6)]
+
+        with django_assert_num_queries(6):
+            instances = baker.make(
+                models.ModelWithAutoNowFields, created=iter(dates), _quantity=5
+            )
+
+        assert [instance.created for instance in instances] == dates
+        assert (
+            sorted(
+                models.ModelWithAutoNowFields.objects.values_list("created", flat=True)
+            )
+            == dates
+        )
+
+    @pytest.mark.django_db
+    def test_bulk_create_with_auto_now(self, settings, django_assert_num_queries):
+        tzinfo = datetime.timezone.utc if settings.USE_TZ else None
+        now = datetime.datetime(2023, 10, 20, 15, 30, tzinfo=tzinfo)
+
+        with django_assert_num_queries(2):
+            instances = baker.make(
+                models.ModelWithAutoNowFields,
+                created=now,
+                updated=now,
+                _quantity=5,
+                _bulk_create=True,
+            )
+
+        for instance in instances:
+            assert instance.created == instance.updated == now
+        assert set(
+            models.ModelWithAutoNowFields.objects.values_list("created", "updated")
+        ) == {(now, now)}
+
 
 class TestFieldSpecificIntegerGenerators:
     @pytest.mark.django_db
@@ -1737,3 +2097,102 @@ class TestGetFields:
         """get_fields() includes private fields (e.g. GFK fields)."""
         fields = baker.Baker(models.ModelWithPrivateField).get_fields()
         assert "marker" in {f.name for f in fields}
+
+
+class TestBakePlan:
+    """Tests for the bake plans compiled by Baker._bake_plan()."""
+
+    @pytest.fixture(autouse=True)
+    def clear_plans(self):
+        baker.clear_bake_plans()
+        yield
+        baker.clear_bake_plans()
+
+    def _plan(self, baker_instance, **attrs):
+        baker_instance._clean_attrs(attrs)
+        return baker_instance._bake_plan(commit=False)
+
+    def test_plan_is_shared_between_calls(self):
+        first = self._plan(baker.Baker(models.Person))
+        second = self._plan(baker.Baker(models.Person))
+        assert first is second
+
+    def test_plan_depends_on_given_attr_names(self):
+        plan = self._plan(baker.Baker(models.Person))
+        plan_with_name = self._plan(baker.Baker(models.Person), name="John")
+        assert plan is not plan_with_name
+        assert dict(plan)[models.Person._meta.get_field("name")] is not None
+        assert dict(plan_with_name)[models.Person._meta.get_field("name")] is None
+
+    def test_plan_depends_on_fill_optional(self):
+        plan = self._plan(baker.Baker(models.DummyBlankFieldsModel))
+        optional_plan = self._plan(
+            baker.Baker(models.DummyBlankFieldsModel), _fill_optional=True
+        )
+        assert len(optional_plan) > len(plan)
+
+    def test_plan_is_cleared_when_settings_change(self, settings):
+        plan = self._plan(baker.Baker(models.Person))
+        settings.BAKER_CUSTOM_FIELDS_GEN = {}
+        assert self._plan(baker.Baker(models.Person)) is not plan
+
+    def test_plan_is_cleared_when_generator_is_added(self):
+        plan = self._plan(baker.Baker(models.Person))
+        baker.generators.add(
+            "tests.generic.fields.CustomFieldViaSettings",
+            baker.generators.get(CustomFieldViaSettings),
+        )
+        assert self._plan(baker.Baker(models.Person)) is not plan
+
+    def test_plan_depends_on_instance_type_mapping(self):
+        def gen_name():
+            return "mapped"
+
+        baker_instance = baker.Baker(models.Cake)
+        baker_instance.type_mapping[CharField] = gen_name
+        assert baker_instance.prepare().name == "mapped"
+        assert baker.prepare(models.Cake).name != "mapped"
+
+    def test_plan_depends_on_instance_attr_mapping(self):
+        baker_instance = baker.Baker(models.Cake)
+        baker_instance.attr_mapping = {"name": lambda: "mapped"}
+        assert baker_instance.prepare().name == "mapped"
+        assert baker.prepare(models.Cake).name != "mapped"
+
+    def test_plan_leaves_overridden_generate_value_in_charge(self):
+        class ConstantNameBaker(baker.Baker):
+            def generate_value(self, field, commit=True, _full_clean=False):
+                if field.name == "name":
+                    return "constant"
+                return super().generate_value(field, commit, _full_clean)
+
+        assert all(
+            generator_plan is None
+            for _, generator_plan in self._plan(ConstantNameBaker(models.Person))
+        )
+        assert ConstantNameBaker(models.Person).prepare().name == "constant"
+
+
+class TestConcurrentBaking:
+    def test_baking_does_not_store_state_on_fields(self):
+        baker.prepare(models.DummyBlankFieldsModel, _fill_optional=True)
+        baker.prepare(models.User, _save_related=False, _using=settings.EXTRA_DB)
+
+        for model in (models.DummyBlankFieldsModel, models.User):
+            for field in model._meta.get_fields():
+                assert not hasattr(field, "fill_optional")
+                assert not hasattr(field, "_using")
+
+    def test_fill_optional_does_not_leak_between_threads(self):
+        def prepare(fill_optional):
+            instance = baker.prepare(
+                models.DummyBlankFieldsModel, _fill_optional=fill_optional
+            )
+            return fill_optional, instance
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(prepare, [True, False] * 200))
+
+        for fill_optional, instance in results:
+            assert bool(instance.blank_char_field) is fill_optional
+            assert bool(instance.blank_text_field) is fill_optional
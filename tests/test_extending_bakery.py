@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from model_bakery import baker
@@ -156,3 +158,23 @@ class TestCustomizeBakerClassViaSettings:
             StrictGenerateValueBaker
         )
         assert baker.make(Profile, _full_clean=True).pk
+
+    def test_custom_baker_class_is_resolved_once(self, settings):
+        settings.BAKER_CUSTOM_CLASS = self.class_to_import_string(BakerSubclass)
+        with patch.object(
+            baker, "import_from_str", wraps=baker.import_from_str
+        ) as import_from_str:
+            baker.Baker.create(Person)
+            baker.Baker.create(Person)
+
+        import_from_str.assert_called_once()
+
+    def test_custom_baker_class_cache_follows_setting_changes(self, settings):
+        settings.BAKER_CUSTOM_CLASS = self.class_to_import_string(BakerSubclass)
+        assert baker.Baker.create(Person).__class__ == BakerSubclass
+
+        settings.BAKER_CUSTOM_CLASS = self.class_to_import_string(BakerDuck)
+        assert baker.Baker.create(Person).__class__ == BakerDuck
+
+        del settings.BAKER_CUSTOM_CLASS
+        assert baker.Baker.create(Person).__class__ == baker.Baker
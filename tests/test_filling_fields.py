@@ -1,8 +1,10 @@
+import string
 import uuid
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from os.path import abspath
 from tempfile import gettempdir
+from unittest.mock import patch
 
 import django
 from django.conf import settings
@@ -16,8 +18,8 @@ from django.db.models import FileField, ImageField, JSONField, fields
 
 import pytest
 
-from model_bakery import baker
-from model_bakery.content_types import BAKER_CONTENTTYPES
+from model_bakery import baker, numpy_gen, random_gen
+from model_bakery.content_types import BAKER_CONTENTTYPES, clear_content_types_cache
 from model_bakery.gis import BAKER_GIS
 from model_bakery.random_gen import MAX_LENGTH, gen_from_choices, gen_related
 from tests.generic import generators, models
@@ -102,6 +104,45 @@ class TestGenFromChoices:
         values = {gen() for _ in range(100)}
         assert None in values
 
+    def test_choices_generator_is_built_once_per_field(self):
+        with (
+            patch.dict(baker._choices_generators, clear=True),
+            patch.object(
+                random_gen, "gen_from_choices", wraps=random_gen.gen_from_choices
+            ) as gen,
+        ):
+            baker.prepare(models.Person)
+            baker.prepare(models.Person, _fill_optional=True)
+            baker.prepare(models.Person, name="name")
+
+        choices = [call.args[0] for call in gen.call_args_list]
+        assert choices
+        assert len(choices) == len({id(c) for c in choices})
+
+    def test_callable_choices_are_evaluated_again(self, monkeypatch):
+        assert baker.prepare(models.IceCream).flavor in ("vanilla", "chocolate")
+
+        monkeypatch.setattr(models, "FLAVOR_CHOICES", [("mint", "Mint")])
+        assert baker.prepare(models.IceCream).flavor == "mint"
+        ice_creams = baker.prepare(models.IceCream, _quantity=3)
+        assert {ice_cream.flavor for ice_cream in ice_creams} == {"mint"}
+
+
+class TestGenFromList:
+    def test_samples_ranges_without_materializing_them(self):
+        gen = random_gen.gen_from_list(range(10**15))
+        assert all(0 <= gen() < 10**15 for _ in range(100))
+
+    def test_follows_changes_to_the_list(self):
+        values = ["A"]
+        gen = random_gen.gen_from_list(values)
+        values[:] = ["B"]
+        assert gen() == "B"
+
+    def test_accepts_other_iterables(self):
+        gen = random_gen.gen_from_list({"A", "B"})
+        assert {gen() for _ in range(100)} == {"A", "B"}
+
 
 class TestStringFieldsFilling:
     def test_fill_CharField_with_a_random_str(self, person):
@@ -273,6 +314,180 @@ class TestFillingOthersNumericFields:
         assert isinstance(self.dummy_decimal_model.decimal_field, Decimal)
 
 
+class TestBatchGenerators:
+    def test_gen_string_batch(self):
+        values = random_gen.gen_string.batch(5, max_length=12)
+        assert len(values) == 5
+        assert all(len(value) == 12 and value.isalpha() for value in values)
+
+    def test_gen_string_batch_without_length(self):
+        assert random_gen.gen_string.batch(3, max_length=0) == ["", "", ""]
+
+    def test_gen_decimal_batch(self):
+        values = random_gen.gen_decimal.batch(5, max_digits=5, decimal_places=2)
+        assert len(values) == 5
+        for value in values:
+            assert isinstance(value, Decimal)
+            assert value.as_tuple().exponent == -2
+            assert abs(value) < 100
+
+    def test_gen_uuid_batch(self):
+        values = random_gen.gen_uuid.batch(5)
+        assert len(set(values)) == 5
+        assert all(value.version == 4 for value in values)
+
+    def test_integer_batch_respects_field_range(self):
+        values = random_gen.gen_positive_small_integer.batch(50)
+        assert all(0 <= value <= 32767 for value in values)
+        values = random_gen.gen_small_integer.batch(50, min_int=1, max_int=3)
+        assert set(values) <= {1, 2, 3}
+
+    def test_integer_batch_matches_single_values_when_seeded(self):
+        state = random_gen.baker_random.getstate()
+        try:
+            random_gen.baker_random.seed(7)
+            single = [random_gen.gen_regular_integer() for _ in range(5)]
+            random_gen.baker_random.seed(7)
+            assert random_gen.gen_regular_integer.batch(5) == single
+        finally:
+            random_gen.baker_random.setstate(state)
+
+    def test_make_with_quantity_fills_columns_in_one_call(self, db):
+        with patch.object(
+            random_gen.gen_string,
+            "batch",
+            wraps=random_gen.gen_string.batch,
+        ) as batch:
+            cakes = baker.make(models.Cake, _quantity=4)
+
+        batch.assert_called_once_with(4, max_length=64)
+        assert len({cake.name for cake in cakes}) == 4
+
+    def test_bulk_create_fills_columns_in_one_call(self, db):
+        with patch.object(
+            random_gen.gen_string,
+            "batch",
+            wraps=random_gen.gen_string.batch,
+        ) as batch:
+            baker.make(models.Cake, _quantity=4, _bulk_create=True)
+
+        batch.assert_called_once_with(4, max_length=64)
+        assert models.Cake.objects.count() == 4
+
+    def test_single_make_does_not_use_batch(self):
+        with patch.object(random_gen.gen_string, "batch") as batch:
+            baker.prepare(models.Cake)
+
+        batch.assert_not_called()
+
+    def test_given_values_are_not_batched(self):
+        with patch.object(random_gen.gen_string, "batch") as batch:
+            cakes = baker.prepare(models.Cake, name="cake", _quantity=3)
+
+        batch.assert_not_called()
+        assert [cake.name for cake in cakes] == ["cake"] * 3
+
+
+class TestBatchBackend:
+    def test_backend_from_settings(self, settings):
+        def backend(generator, quantity):
+            if generator is random_gen.gen_string:
+                return lambda n, max_length: ["x" * max_length] * n
+            return None
+
+        settings.BAKER_BATCH_BACKEND = backend
+        cakes = baker.prepare(models.Cake, _quantity=3)
+
+        assert [cake.name for cake in cakes] == ["x" * 64] * 3
+
+    def test_backend_falls_back_to_generator_batch(self, settings):
+        settings.BAKER_BATCH_BACKEND = lambda generator, quantity: None
+        with patch.object(
+            random_gen.gen_string, "batch", wraps=random_gen.gen_string.batch
+        ) as batch:
+            baker.prepare(models.Cake, _quantity=3)
+
+        batch.assert_called_once_with(3, max_length=64)
+
+    def test_backend_can_be_disabled(self, settings):
+        settings.BAKER_BATCH_BACKEND = False
+        with patch.object(numpy_gen, "get_batch") as get_batch:
+            baker.prepare(models.Cake, _quantity=3)
+
+        get_batch.assert_not_called()
+
+
+@pytest.mark.skipif(not numpy_gen.BAKER_NUMPY, reason="NumPy is not installed")
+class TestNumpyBatchBackend:
+    quantity = numpy_gen.NUMPY_MIN_QUANTITY
+
+    def test_columns_respect_field_ranges(self):
+        values = baker.prepare(models.DummyPositiveIntModel, _quantity=self.quantity)
+
+        assert all(0 <= v.positive_small_int_field <= 32767 for v in values)
+        assert all(isinstance(v.positive_int_field, int) for v in values)
+        assert len({v.positive_big_int_field for v in values}) > 1
+
+    def test_columns_are_reproducible_when_seeded(self):
+        state = random_gen.baker_random.getstate()
+        try:
+            random_gen.baker_random.seed(5)
+            first = baker.prepare(models.DummyIntModel, _quantity=self.quantity)
+            random_gen.baker_random.seed(5)
+            second = baker.prepare(models.DummyIntModel, _quantity=self.quantity)
+        finally:
+            random_gen.baker_random.setstate(state)
+
+        assert [v.int_field for v in first] == [v.int_field for v in second]
+
+    def test_decimals_and_uuids(self):
+        decimals = numpy_gen.get_batch(random_gen.gen_decimal, self.quantity)(
+            10, max_digits=5, decimal_places=2
+        )
+        uuids = numpy_gen.get_batch(random_gen.gen_uuid, self.quantity)(10)
+
+        assert all(abs(value) < 100 for value in decimals)
+        assert all(value.as_tuple().exponent == -2 for value in decimals)
+        assert len(set(uuids)) == 10
+        assert all(value.version == 4 for value in uuids)
+
+    def test_small_quantities_keep_pure_python_generators(self):
+        assert numpy_gen.get_batch(random_gen.gen_regular_integer, 10) is None
+
+
+class TestStringGenerators:
+    @pytest.fixture
+    def seeded(self):
+        state = random_gen.baker_random.getstate()
+        yield random_gen.baker_random.seed
+        random_gen.baker_random.setstate(state)
+
+    def test_strings_are_reproducible_when_seeded(self, seeded):
+        seeded(3)
+        first = [random_gen.gen_string(300), random_gen.gen_slug(50)]
+        seeded(3)
+        assert [random_gen.gen_string(300), random_gen.gen_slug(50)] == first
+
+    def test_strings_use_the_whole_alphabet(self):
+        assert set(random_gen.gen_string(5000)) == set(string.ascii_letters)
+        slug_chars = string.ascii_letters + string.digits + "_-"
+        assert set(random_gen.gen_slug(5000)) == set(slug_chars)
+
+    def test_string_lengths(self):
+        assert random_gen.gen_string(0) == ""
+        assert len(random_gen.gen_string(1000)) == 1000
+        assert len(random_gen.gen_byte_string(7)) == 7
+
+    def test_ip_addresses_have_no_zero_parts(self):
+        for _ in range(100):
+            octets = random_gen.gen_ipv4().split(".")
+            assert len(octets) == 4
+            assert all(1 <= int(octet) <= 255 for octet in octets)
+            groups = random_gen.gen_ipv6().split(":")
+            assert len(groups) == 8
+            assert all(1 <= int(group, 16) <= 65535 for group in groups)
+
+
 class TestURLFieldsFilling:
     def test_fill_URLField_with_valid_url(self, person):
         blog_field = models.Person._meta.get_field("blog")
@@ -321,6 +536,7 @@ class TestFillingGenericForeignKeyField:
         from django.contrib.contenttypes.models import ContentType
 
         ContentType.objects.clear_cache()
+        clear_content_types_cache()
 
     @pytest.mark.django_db
     def test_content_type_field(self):
@@ -436,6 +652,47 @@ class TestFillingGenericForeignKeyField:
         assert dummy.content_type is None
         assert dummy.object_id is None
 
+    @pytest.mark.django_db
+    def test_content_types_are_resolved_once(self, django_assert_num_queries):
+        baker.make(models.DummyGenericForeignKeyModel)
+        profile = baker.make(models.Profile)
+
+        # only the inserts, content types come from baker's cache
+        with django_assert_num_queries(2):
+            baker.make(models.DummyGenericForeignKeyModel)
+            baker.make(models.DummyGenericForeignKeyModel, content_object=profile)
+
+    @pytest.mark.django_db
+    def test_prepare_uses_resolved_content_type(self):
+        from django.contrib.contenttypes.models import ContentType
+
+        profile = baker.make(models.Profile)
+        baker.make(models.DummyGenericForeignKeyModel, content_object=profile)
+
+        dummy = baker.prepare(
+            models.DummyGenericForeignKeyModel, content_object=profile
+        )
+
+        assert dummy.content_type == ContentType.objects.get_for_model(models.Profile)
+        assert dummy.content_type.pk is not None
+
+    @pytest.mark.django_db
+    def test_content_types_cache_is_cleared_after_migrations(self):
+        from django.apps import apps
+        from django.db.models.signals import post_migrate
+
+        from model_bakery import content_types
+
+        baker.make(models.DummyGenericForeignKeyModel)
+        assert content_types._content_types
+
+        app_config = apps.get_app_config("generic")
+        post_migrate.send(
+            sender=app_config, app_config=app_config, using="default", verbosity=0
+        )
+
+        assert not content_types._content_types
+
 
 class TestFillingForeignKeyFieldWithDefaultFunctionReturningId:
     @pytest.mark.django_db
@@ -508,6 +765,66 @@ class TestsFillingFileField:
 
         dummy.delete()
 
+    def test_mock_file_is_read_once(self):
+        first = random_gen.gen_file_field()
+        with patch("builtins.open") as mock_open:
+            second = random_gen.gen_file_field()
+
+        mock_open.assert_not_called()
+        assert first is not second
+        assert first.read() == second.read()
+
+    @pytest.mark.django_db
+    def test_create_files_in_memory(self, settings):
+        settings.BAKER_IN_MEMORY_FILES = True
+        storage = models.DummyFileFieldModel._meta.get_field("file_field").storage
+
+        dummy = baker.make(models.DummyFileFieldModel, _create_files=True)
+
+        assert not storage.exists(dummy.file_field.name)
+        assert dummy.file_field.read() == random_gen.gen_file_field().read()
+        dummy.refresh_from_db()
+        assert dummy.file_field.name.endswith("mock_file.txt")
+
+    @pytest.mark.django_db
+    def test_bulk_create_files_in_memory(self, settings):
+        settings.BAKER_IN_MEMORY_FILES = True
+        storage = models.DummyFileFieldModel._meta.get_field("file_field").storage
+
+        dummies = baker.make(
+            models.DummyFileFieldModel,
+            _create_files=True,
+            _quantity=2,
+            _bulk_create=True,
+        )
+
+        for dummy in dummies:
+            assert not storage.exists(dummy.file_field.name)
+            assert dummy.file_field.read()
+
+    @pytest.mark.django_db
+    def test_clear_in_memory_files(self, settings):
+        settings.BAKER_IN_MEMORY_FILES = True
+        dummy = baker.make(models.DummyFileFieldModel, _create_files=True)
+        storage = dummy.file_field.storage
+        assert storage.exists(dummy.file_field.name)
+
+        baker.clear_in_memory_files()
+
+        other = baker.make(models.DummyFileFieldModel, _create_files=True)
+        assert other.file_field.storage is not storage
+
+    @pytest.mark.django_db
+    def test_in_memory_files_are_cleared_on_setting_changed(self, settings):
+        settings.BAKER_IN_MEMORY_FILES = True
+        dummy = baker.make(models.DummyFileFieldModel, _create_files=True)
+
+        settings.BAKER_IN_MEMORY_FILES = False
+        settings.BAKER_IN_MEMORY_FILES = True
+
+        other = baker.make(models.DummyFileFieldModel, _create_files=True)
+        assert other.file_field.storage is not dummy.file_field.storage
+
 
 class TestFillingCustomFields:
     def test_raises_unsupported_field_for_custom_field(self, custom_cfg):
@@ -580,6 +897,22 @@ class TestFillingCustomFields:
         obj = baker.prepare(models.CustomFieldViaSettingsModel)
         assert obj.custom_value == "always the same text"
 
+    def test_type_mapping_from_settings_is_built_once(self, custom_cfg):
+        settings.BAKER_CUSTOM_FIELDS_GEN = {
+            "tests.generic.fields.CustomFieldWithGenerator": "tests.generic.generators.gen_value_string"
+        }
+        baker.Baker(models.CustomFieldWithGeneratorModel)
+        with patch.object(baker.generators, "get_type_mapping") as get_type_mapping:
+            baker_instance = baker.Baker(models.CustomFieldWithGeneratorModel)
+
+        get_type_mapping.assert_not_called()
+        assert baker_instance.prepare().custom_value == "value"
+
+    def test_type_mapping_is_not_shared_between_bakers(self):
+        baker_instance = baker.Baker(models.Person)
+        baker_instance.type_mapping[fields.CharField] = generators.gen_value_string
+        assert baker.prepare(models.Person).name != "value"
+
 
 class TestFillingAutoFields:
     @pytest.mark.django_db
@@ -607,6 +940,17 @@ class TestFillingImageFileField:
         assert dummy.image_field.height
         dummy.image_field.delete()
 
+    @pytest.mark.django_db
+    def test_filling_image_file_field_in_memory(self, settings):
+        settings.BAKER_IN_MEMORY_FILES = True
+        storage = models.DummyImageFieldModel._meta.get_field("image_field").storage
+
+        dummy = baker.make(models.DummyImageFieldModel, _create_files=True)
+
+        assert not storage.exists(dummy.image_field.name)
+        assert dummy.image_field.width
+        assert dummy.image_field.height
+
     @pytest.mark.django_db
     def test_does_not_create_file_if_not_flagged(self):
         dummy = baker.make(models.DummyImageFieldModel)
@@ -4,12 +4,12 @@ from decimal import Decimal
 from random import choice  # noqa
 from unittest.mock import patch
 
-from django.db import connection
+from django.db import connection, transaction
 from django.utils.timezone import now
 
 import pytest
 
-from model_bakery import baker
+from model_bakery import baker, recipe
 from model_bakery.exceptions import InvalidQuantityException, RecipeIteratorEmpty
 from model_bakery.recipe import Recipe, RecipeForeignKey, foreign_key, seq
 from model_bakery.timezone import tz_aware
@@ -20,8 +20,11 @@ from tests.generic.models import (
     DummyBlankFieldsModel,
     DummyNullFieldsModel,
     DummyNumbersModel,
+    Home,
+    HomeOwner,
     LonelyPerson,
     ModelWithAutoNowFields,
+    NonAbstractPerson,
     Person,
     Profile,
     User,
@@ -215,6 +218,99 @@ class TestDefiningRecipes:
         assert person2.acquaintances == [1, 2, 3, 4]
         assert person3.acquaintances == [1, 2, 3]
 
+    def test_recipe_nested_attribute_isolation(self):
+        nested_recipe = person_recipe.extend(data={"one": {"two": 2}})
+        person1 = nested_recipe.prepare()
+        person1.data["one"]["three"] = 3
+
+        assert nested_recipe.prepare().data == {"one": {"two": 2}}
+
+    def test_recipe_immutable_attribute_is_shared(self):
+        tags = ("a", ("b", 1))
+        tagged_recipe = person_recipe.extend(data=tags)
+
+        assert tagged_recipe.prepare().data is tags
+        assert tagged_recipe.prepare().data is tags
+
+    def test_recipe_attrs_are_compiled_once(self):
+        r = Recipe(Person, **recipe_attrs)
+        with patch(
+            "model_bakery.recipe._compile_attr", wraps=recipe._compile_attr
+        ) as compile_attr:
+            r.prepare()
+            r.prepare(_quantity=2)
+            assert compile_attr.call_count == len(recipe_attrs)
+
+            compile_attr.reset_mock()
+            extended = r.extend(name="Extended")
+            assert extended.prepare().name == "Extended"
+            compile_attr.assert_called_once_with("Extended")
+
+
+class TestPreparedTemplates:
+    def test_prepare_clones_fully_determined_recipe(self):
+        r = Recipe(DummyBlankFieldsModel, blank_char_field="a", blank_text_field="b")
+        with patch("model_bakery.baker.prepare", wraps=baker.prepare) as prepare:
+            first = r.prepare()
+            second = r.prepare()
+            many = r.prepare(_quantity=2)
+        prepare.assert_called_once()
+
+        instances = [first, second, *many]
+        assert len({id(instance) for instance in instances}) == 4
+        assert len({id(instance._state) for instance in instances}) == 4
+        for instance in instances:
+            assert instance.pk is None
+            assert instance._state.adding
+            assert instance.blank_char_field == "a"
+            assert instance.blank_text_field == "b"
+
+    @pytest.mark.django_db
+    def test_cloned_instances_can_be_saved(self):
+        r = Recipe(DummyBlankFieldsModel, blank_char_field="a", blank_text_field="b")
+        first = r.prepare()
+        first.save()
+        second = r.prepare()
+        assert second.pk is None
+        second.save()
+        assert first.pk != second.pk
+
+    def test_prepare_runs_post_init_receivers(self):
+        from django.db.models.signals import post_init
+
+        r = Recipe(DummyBlankFieldsModel, blank_char_field="a", blank_text_field="b")
+        initialized = []
+
+        def receiver(instance, **kwargs):
+            initialized.append(instance)
+
+        post_init.connect(receiver, sender=DummyBlankFieldsModel)
+        try:
+            instances = [r.prepare(), r.prepare()]
+        finally:
+            post_init.disconnect(receiver, sender=DummyBlankFieldsModel)
+        assert initialized[-2:] == instances
+
+    def test_prepare_with_overrides_is_not_cloned(self):
+        r = Recipe(DummyBlankFieldsModel, blank_char_field="a", blank_text_field="b")
+        assert r.prepare(blank_char_field="c").blank_char_field == "c"
+        assert r.prepare().blank_char_field == "a"
+
+    @pytest.mark.parametrize(
+        "attrs",
+        [
+            {"blank_char_field": "a"},
+            {"blank_char_field": "a", "blank_text_field": lambda: "b"},
+            {"blank_char_field": "a", "blank_text_field": seq("b")},
+        ],
+    )
+    def test_recipe_with_generated_values_is_not_cloned(self, attrs):
+        r = Recipe(DummyBlankFieldsModel, **attrs)
+        with patch("model_bakery.baker.prepare", wraps=baker.prepare) as prepare:
+            r.prepare()
+            r.prepare()
+        assert prepare.call_count == 2
+
 
 class TestExecutingRecipes:
     """Tests for calling recipes defined in baker_recipes.py."""
@@ -511,12 +607,92 @@ class TestForeignKey:
         movie = baker.make_recipe("tests.generic.movie_with_cast")
         assert movie.cast_members.count() == 2
 
+    @pytest.mark.django_db
+    def test_related_with_bulk_create(self, django_assert_num_queries):
+        # the movies, then a person and the cast members of each `cast_member`
+        with django_assert_num_queries(5):
+            movies = baker.make_recipe(
+                "tests.generic.movie_with_cast", _quantity=3, _bulk_create=True
+            )
+        for movie in movies:
+            assert movie.cast_members.count() == 2
+
+    @pytest.mark.django_db
+    def test_foreign_key_with_bulk_create(self):
+        with patch.object(Person, "save") as save:
+            cast_members = baker.make_recipe(
+                "tests.generic.cast_member", _quantity=2, _bulk_create=True
+            )
+        save.assert_not_called()
+        assert cast_members[0].person.pk
+        assert cast_members[0].person == cast_members[1].person
+
+    @pytest.mark.django_db
+    def test_related_with_bulk_create_of_ordered_model(self):
+        # `Dog` is ordered with respect to its owner, so it can't be bulk created
+        dog_ladies = baker.make_recipe(
+            "tests.generic.dog_lady", _quantity=2, _bulk_create=True
+        )
+        for dog_lady in dog_ladies:
+            assert dog_lady.dog_set.count() == 2
+
+    @pytest.mark.django_db
+    def test_foreign_key_with_bulk_create_of_inherited_model(self):
+        homes = Recipe(Home, owner=foreign_key(Recipe(NonAbstractPerson))).make(
+            _quantity=2, _bulk_create=True
+        )
+        assert isinstance(homes[0].owner, NonAbstractPerson)
+        assert homes[0].owner.pk
+        assert homes[0].owner == homes[1].owner
+
     @pytest.mark.django_db
     def test_one_to_one_relationship(self):
         lonely_people = baker.make_recipe("tests.generic.lonely_person", _quantity=2)
         friend_ids = {x.only_friend.id for x in lonely_people}
         assert len(friend_ids) == 2
 
+    @pytest.mark.django_db
+    def test_one_to_one_relationship_with_bulk_create(self, django_assert_num_queries):
+        # one insert for the friends, then one for the lonely people
+        with django_assert_num_queries(2):
+            lonely_people = baker.make_recipe(
+                "tests.generic.lonely_person", _quantity=3, _bulk_create=True
+            )
+        friend_ids = {x.only_friend.id for x in lonely_people}
+        assert len(friend_ids) == 3
+        assert Person.objects.filter(id__in=friend_ids).count() == 3
+
+    @pytest.mark.django_db
+    def test_one_to_one_relationship_with_bulk_create_of_inherited_model(self):
+        lonely_people = Recipe(
+            LonelyPerson,
+            only_friend=foreign_key(Recipe(NonAbstractPerson), one_to_one=True),
+        ).make(_quantity=2, _bulk_create=True)
+        friends = [x.only_friend for x in lonely_people]
+        assert all(isinstance(friend, NonAbstractPerson) for friend in friends)
+        assert len({friend.pk for friend in friends}) == 2
+
+    @pytest.mark.django_db
+    def test_one_to_one_relationship_made_with_quantity(self):
+        lonely_recipe = Recipe(
+            LonelyPerson, only_friend=foreign_key(person_recipe, one_to_one=True)
+        )
+        with patch.object(
+            person_recipe, "make", wraps=person_recipe.make
+        ) as make_friends:
+            lonely_people = lonely_recipe.make(_quantity=3)
+        make_friends.assert_called_once()
+        assert len({x.only_friend_id for x in lonely_people}) == 3
+
+    @pytest.mark.django_db
+    def test_one_to_one_relationship_keeps_nested_foreign_keys_unique(self):
+        home_recipe = Recipe(Home, owner=foreign_key(person_recipe))
+        home_owners = Recipe(
+            HomeOwner, home=foreign_key(home_recipe, one_to_one=True)
+        ).make(_quantity=3)
+        assert len({x.home_id for x in home_owners}) == 3
+        assert len({x.home.owner_id for x in home_owners}) == 3
+
 
 class TestM2MField:
     @pytest.mark.django_db
@@ -717,6 +893,52 @@ class TestSequences:
         person = baker.prepare_recipe("tests.generic.serial_person")
         assert person.name == "joe5"
 
+    @pytest.mark.django_db
+    def test_increment_restarts_after_rollback(self):
+        with transaction.atomic():
+            baker.make_recipe("tests.generic.serial_person")
+            transaction.set_rollback(True)
+        person = baker.make_recipe("tests.generic.serial_person")
+        assert person.name == "joe1"
+
+    @pytest.mark.django_db
+    def test_increment_continues_after_commit(self):
+        with transaction.atomic():
+            first = baker.make_recipe("tests.generic.serial_person")
+        person = baker.make_recipe("tests.generic.serial_person")
+        assert person.name == f"joe{int(first.name[3:]) + 1}"
+
+    def test_prepare_does_not_query_the_database(self):
+        # no `django_db` mark: any query would fail the test
+        baker.reset_sequences()
+        assert baker.prepare_recipe("tests.generic.serial_person").name == "joe1"
+        assert baker.prepare_recipe("tests.generic.serial_person").name == "joe2"
+
+    @pytest.mark.django_db
+    def test_make_does_not_check_for_existing_rows(self, django_assert_num_queries):
+        baker.make_recipe("tests.generic.serial_person")
+        with django_assert_num_queries(1):
+            baker.make_recipe("tests.generic.serial_person")
+
+    def test_reset_sequences(self):
+        baker.prepare_recipe("tests.generic.serial_person")
+        baker.prepare_recipe("tests.generic.serial_person")
+        baker.reset_sequences()
+        assert baker.prepare_recipe("tests.generic.serial_person").name == "joe1"
+
+    @pytest.mark.django_db
+    def test_sequences_restart_after_migrations(self):
+        from django.apps import apps
+        from django.db.models.signals import post_migrate
+
+        baker.prepare_recipe("tests.generic.serial_person")
+        post_migrate.send(
+            sender=apps.get_app_config("generic"),
+            app_config=apps.get_app_config("generic"),
+            verbosity=0,
+        )
+        assert baker.prepare_recipe("tests.generic.serial_person").name == "joe1"
+
 
 class TestIterators:
     @pytest.mark.django_db
@@ -756,6 +978,37 @@ class TestIterators:
         )
         assert r.make().blank_text_field == "not an iterator, so don't iterate!"
 
+    def test_reset_restarts_iterators(self):
+        r = Recipe(DummyBlankFieldsModel, blank_char_field=iter(["a", "b", "c"]))
+        assert r.prepare().blank_char_field == "a"
+        assert r.prepare().blank_char_field == "b"
+        baker.reset_sequences()
+        assert r.prepare().blank_char_field == "a"
+
+    def test_seq_does_not_keep_generated_values(self):
+        r = Recipe(DummyBlankFieldsModel, blank_char_field=seq("a"))
+        r.prepare(_quantity=3)
+        # the values of a `seq` are generated again when it is restarted,
+        # instead of being buffered by `itertools.tee`
+        iterator = r._iterators[id(r.attr_mapping["blank_char_field"])].iterator
+        assert not isinstance(iterator, type(itertools.tee([])[0]))
+        baker.reset_sequences()
+        assert r.prepare().blank_char_field == "a1"
+
+    @pytest.mark.django_db
+    def test_extended_recipe_shares_seq(self):
+        r = Recipe(Person, name=seq("joe"))
+        assert r.make().name == "joe1"
+        assert r.extend(age=10).make().name == "joe2"
+        assert r.make().name == "joe3"
+
+    def test_extended_recipe_shares_iterators(self):
+        r = Recipe(DummyBlankFieldsModel, blank_char_field=iter(["a", "b", "c"]))
+        extended = r.extend(blank_text_field="text")
+        assert r.prepare().blank_char_field == "a"
+        assert extended.prepare().blank_char_field == "b"
+        assert r.prepare().blank_char_field == "c"
+
 
 class TestAutoNowFields:
     @pytest.mark.django_db
@@ -1,6 +1,7 @@
 import datetime
 from decimal import Decimal
 from inspect import getmodule
+from unittest.mock import patch
 
 import pytest
 
@@ -49,6 +50,18 @@ def test_get_calling_module():
         assert get_calling_module(100)
 
 
+def test_get_calling_module_does_not_inspect_the_stack():
+    with patch("inspect.stack") as stack:
+        assert get_calling_module(0) == getmodule(test_get_calling_module)
+    stack.assert_not_called()
+
+
+def test_get_calling_module_from_code_without_module():
+    namespace = {"get_calling_module": get_calling_module}
+    exec("module = get_calling_module(0)", namespace)
+    assert namespace["module"] is None
+
+
 class TestSeq:
     def test_string(self):
         sequence = seq("muffin")
@@ -80,6 +93,15 @@ class TestSeq:
 
         assert str(exc.value) == "Sequences suffix can only be a string"
 
+    def test_restart(self):
+        sequence = seq("cookie")
+        assert next(sequence) == "cookie1"
+        assert next(sequence) == "cookie2"
+
+        restarted = sequence.restart()
+        assert next(restarted) == "cookie1"
+        assert next(sequence) == "cookie3"
+
     def test_int(self):
         sequence = seq(1)
         assert next(sequence) == 2